@@ -1,11 +1,22 @@
 import argparse
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 from utils import Color, run_command, print_red
 
-if __name__ == "__main__":
+
+def run_marker_command(command, coverage_file=None):
+    # Runs inside a ProcessPoolExecutor worker, so setting COVERAGE_FILE here
+    # only affects this marker's pytest invocation; without it, concurrent
+    # markers with --coverage-config would all write the same .coverage file.
+    if coverage_file:
+        os.environ["COVERAGE_FILE"] = coverage_file
+    return run_command(command, throw_on_retcode=False)
+
+
+def main():
     parser = argparse.ArgumentParser(description=Color.RED + "Test Coverage for Promptflow!" + Color.END + "\n")
 
     parser.add_argument("-p", required=True, nargs="+", help="The paths to calculate code coverage")
@@ -14,8 +25,9 @@ if __name__ == "__main__":
     parser.add_argument(
         "-m",
         required=True,
-        help="Pytest marker to identify the tests to run",
-        default="all",
+        nargs="+",
+        help="Pytest marker(s) to identify the tests to run; multiple markers run as parallel pytest invocations",
+        default=["all"],
     )
     parser.add_argument(
         "-o",
@@ -69,7 +81,7 @@ if __name__ == "__main__":
     run_command(["pip", "list"])
     run_command(["pip", "show", "promptflow", "promptflow-sdk"])
 
-    pytest_command = ["pytest", "--junitxml=test-results.xml"]
+    pytest_command = ["pytest", f"--junitxml={args.o}"]
     pytest_command += test_paths_list
     if args.coverage_config:
         if args.p:
@@ -89,7 +101,7 @@ if __name__ == "__main__":
         "-n",
         args.n,
         "--dist",
-        "loadfile",
+        "loadgroup",
         "--log-level=info",
         "--log-format=%(asctime)s %(levelname)s %(message)s",
         "--log-date-format=[%Y-%m-%d %H:%M:%S]",
@@ -106,14 +118,43 @@ if __name__ == "__main__":
             "thread",
         ]
 
-    if args.m != "all":
-        pytest_command = pytest_command + ["-m", args.m]
-
     if args.model_name:
         pytest_command = pytest_command + ["--model-name", args.model_name]
 
-    # pytest --junit-xml=test-results.xml --cov=azure.ai.ml --cov-report=html --cov-report=xml -ra ./tests/*/unittests/
-    error_code, _ = run_command(pytest_command, throw_on_retcode=False)
+    markers = [m for m in args.m if m != "all"]
+    if len(markers) > 1:
+        # Amortize interpreter/venv warm-up by running one pytest invocation per
+        # marker concurrently instead of spawning them back to back.
+        commands = []
+        for marker in markers:
+            output = f"{Path(args.o).stem}-{marker}{Path(args.o).suffix}"
+            # Rewrite every per-run output destination, not only --junitxml;
+            # the default html/xml report paths are shared, so concurrent
+            # markers would otherwise overwrite each other's reports.
+            command = []
+            for arg in pytest_command:
+                if arg.startswith("--junitxml="):
+                    arg = f"--junitxml={output}"
+                elif arg == "--cov-report=html":
+                    arg = f"--cov-report=html:htmlcov-{marker}"
+                elif arg == "--cov-report=xml":
+                    arg = f"--cov-report=xml:coverage-{marker}.xml"
+                command.append(arg)
+            coverage_file = f".coverage-{marker}" if args.coverage_config else None
+            commands.append((command + ["-m", marker], coverage_file))
+        error_code = 0
+        with ProcessPoolExecutor(max_workers=min(len(commands), os.cpu_count() or 1)) as pool:
+            futures = [pool.submit(run_marker_command, command, coverage_file) for command, coverage_file in commands]
+            for future in as_completed(futures):
+                retcode, _ = future.result()
+                error_code = error_code or retcode
+    else:
+        if markers:
+            pytest_command = pytest_command + ["-m", markers[0]]
+
+        # pytest --junit-xml=test-results.xml --cov=azure.ai.ml --cov-report=html --cov-report=xml -ra \
+        #     ./tests/*/unittests/
+        error_code, _ = run_command(pytest_command, throw_on_retcode=False)
     # https://docs.pytest.org/en/7.1.x/reference/exit-codes.html
     if error_code == 1:
         print_red("Tests were collected and run but some of the tests failed.")
@@ -126,3 +167,7 @@ if __name__ == "__main__":
     elif error_code == 5:
         print_red("No tests were collected.")
     sys.exit(error_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -247,9 +247,15 @@ def to_bool(value) -> bool:
     return str(value).lower() == "true"
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_jinja_template(prompt, trim_blocks, keep_trailing_newline):
+    return Template(prompt, trim_blocks=trim_blocks, keep_trailing_newline=keep_trailing_newline)
+
+
 def render_jinja_template(prompt, trim_blocks=True, keep_trailing_newline=True, **kwargs):
     try:
-        return Template(prompt, trim_blocks=trim_blocks, keep_trailing_newline=keep_trailing_newline).render(**kwargs)
+        template = _compile_jinja_template(str(prompt), trim_blocks, keep_trailing_newline)
+        return template.render(**kwargs)
     except Exception as e:
         # For exceptions raised by jinja2 module, mark UserError
         print(f"Exception occurs: {type(e).__name__}: {str(e)}", file=sys.stderr)
@@ -1,15 +1,36 @@
+import asyncio
 import functools
 import json
 import os
 import re
 import sys
+import threading
 import time
-import urllib.request
+import weakref
+
+import httpx
+import requests
 
 from abc import abstractmethod
 from enum import Enum
-from typing import Any, Dict, List, Tuple, Mapping, Optional
-from urllib.request import HTTPError
+from requests.exceptions import HTTPError
+from typing import Any, Callable, Dict, List, Tuple, Mapping, Optional
+
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
 
 from promptflow import ToolProvider, tool
 from promptflow.connections import CustomConnection
@@ -21,12 +42,47 @@ from promptflow.tools.exception import (
     OpenSourceLLMKeyValidationError
 )
 
+# simdjson parsers are not thread-safe and each parse() invalidates the
+# previous document; flow nodes run concurrently, so keep one parser per
+# thread (which still reuses its internal buffers across calls).
+_sj_local = threading.local()
+
+
+def _sj_parser():
+    parser = getattr(_sj_local, "parser", None)
+    if parser is None:
+        parser = _sj_local.parser = simdjson.Parser()
+    return parser
+
+
 VALID_LLAMA_ROLES = {"system", "user", "assistant"}
 REQUIRED_CONFIG_KEYS = ["endpoint_url", "model_family"]
 REQUIRED_SECRET_KEYS = ["endpoint_api_key"]
 DEFAULT_ENDPOINT_NAME = "-- please enter an endpoint name --"
 ENDPOINT_REQUIRED_ENV_VARS = ["AZUREML_ARM_SUBSCRIPTION", "AZUREML_ARM_RESOURCEGROUP", "AZUREML_ARM_WORKSPACE_NAME"]
 
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# One pooled async client per running event loop; a module-level client would
+# bind its transport to whichever loop first used it and fail once that loop
+# closes (e.g. repeated asyncio.run calls around abatch). Keyed weakly so
+# clients for collected loops are dropped.
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(timeout=50, limits=httpx.Limits(max_connections=32))
+        _async_clients[loop] = client
+    return client
+
+
+_ESCAPE_RE = re.compile(r'\\([\\\"a-zA-Z])')
+_MODEL_URI_RE = re.compile(r'azureml://registries/[^/]+/models/([^/]+)/versions/')
+
 
 def handle_oneline_endpoint_error(max_retries: int = 3,
                                   initial_delay: float = 1,
@@ -44,14 +100,24 @@ def handle_oneline_endpoint_error(max_retries: int = 3,
                         print(error_message, file=sys.stderr)
                         raise OpenSourceLLMOnlineEndpointError(message=error_message)
 
-                    delay *= exponential_base
                     time.sleep(delay)
+                    delay *= exponential_base
         return wrapper
     return deco_retry
 
 
 def format_generic_response_payload(output: bytes, response_key: str) -> str:
-    response_json = json.loads(output)
+    if simdjson is not None:
+        # Fast path: extract only the field we need without materializing the
+        # whole response tree. Fall through on any parse/shape mismatch so the
+        # slow path can produce the detailed error message.
+        try:
+            doc = _sj_parser().parse(output)
+            return doc.at_pointer("/0" if response_key is None else f"/0/{response_key}")
+        except (ValueError, KeyError, IndexError, TypeError):
+            pass
+
+    response_json = _json_loads(output)
     try:
         if response_key is None:
             return response_json[0]
@@ -78,29 +144,24 @@ Instead, received {response_json} and access failed at key `{e}`.
 
 
 def get_model_type(deployment_model: str) -> str:
-    m = re.match(r'azureml://registries/[^/]+/models/([^/]+)/versions/', deployment_model)
+    m = _MODEL_URI_RE.match(deployment_model)
     if m is None:
         raise ValueError(f"Unexpected model format: {deployment_model}")
     model = m[1].lower()
-    if model.startswith(ModelFamily.LLAMA.lower()):
-        return ModelFamily.LLAMA
-    elif model.startswith(ModelFamily.FALCON.lower()):
-        return ModelFamily.FALCON
-    elif model.startswith(ModelFamily.DOLLY.lower()):
-        return ModelFamily.DOLLY
-    elif model.startswith("gpt2"):
-        return ModelFamily.GPT2
-    else:
-        raise ValueError(f"Unexpected model type: {model} derived from deployed model: {deployment_model}")
+    for prefix, family in _FAMILY_PREFIXES:
+        if model.startswith(prefix):
+            return family
+    raise ValueError(f"Unexpected model type: {model} derived from deployed model: {deployment_model}")
 
 
-def get_deployment_from_endpoint(endpoint_name: str, deployment_name: str = None) -> Tuple[str, str, str]:
+@functools.lru_cache(maxsize=4)
+def _get_ml_client():
     from azure.identity import DefaultAzureCredential
     credential = DefaultAzureCredential(exclude_interactive_browser_credential=False)
 
     try:
         from azure.ai.ml import MLClient
-        ml_client = MLClient(
+        return MLClient(
             credential=credential,
             subscription_id=os.getenv("AZUREML_ARM_SUBSCRIPTION"),
             resource_group_name=os.getenv("AZUREML_ARM_RESOURCEGROUP"),
@@ -111,31 +172,31 @@ def get_deployment_from_endpoint(endpoint_name: str, deployment_name: str = None
         message += "\nException: " + str(e)
         raise OpenSourceLLMOnlineEndpointError(message=message)
 
-    found = False
-    for ep in ml_client.online_endpoints.list():
-        if ep.name == endpoint_name:
-            endpoint_uri = ep.scoring_uri
-            endpoint_key = ml_client.online_endpoints.get_keys(ep.name).primary_key
-            found = True
-            break
 
-    if not found:
+@functools.lru_cache(maxsize=64)
+def get_deployment_from_endpoint(endpoint_name: str, deployment_name: str = None) -> Tuple[str, str, str]:
+    ml_client = _get_ml_client()
+
+    from azure.core.exceptions import ResourceNotFoundError
+
+    try:
+        ep = ml_client.online_endpoints.get(endpoint_name)
+    except ResourceNotFoundError:
         raise ValueError(f"Endpoint {endpoint_name} not found.")
 
-    found = False
-    if deployment_name is None:
-        deployment_name = sorted(ep.traffic, key=lambda item: item[1])[0]
-        found = True
+    endpoint_uri = ep.scoring_uri
+    endpoint_key = ml_client.online_endpoints.get_keys(ep.name).primary_key
 
-    for d in ml_client.online_deployments.list(ep.name):
-        if d.name == deployment_name:
-            model = get_model_type(d.model)
-            found = True
-            break
+    if deployment_name is None:
+        deployment_name = max(ep.traffic.items(), key=lambda kv: kv[1])[0]
 
-    if not found:
+    try:
+        d = ml_client.online_deployments.get(name=deployment_name, endpoint_name=ep.name)
+    except ResourceNotFoundError:
         raise ValueError(f"Deployment {deployment_name} not found.")
 
+    model = get_model_type(d.model)
+
     return (endpoint_uri, endpoint_key, model)
 
 
@@ -175,6 +236,9 @@ class ModelFamily(str, Enum):
     FALCON = "Falcon"
 
 
+_FAMILY_PREFIXES = tuple((family.value.lower(), family) for family in ModelFamily) + (("gpt2", ModelFamily.GPT2),)
+
+
 class API(str, Enum):
     CHAT = "chat"
     COMPLETION = "completion"
@@ -194,16 +258,13 @@ class ContentFormatterBase:
     @staticmethod
     def escape_special_characters(prompt: str) -> str:
         """Escapes any special characters in `prompt`"""
-        return re.sub(
-            r'\\([\\\"a-zA-Z])',
-            r'\\\1',
-            prompt)
+        return _ESCAPE_RE.sub(r'\\\1', prompt)
 
     @abstractmethod
-    def format_request_payload(self, prompt: str, model_kwargs: Dict) -> str:
+    def format_request_payload(self, prompt: str, model_kwargs: Dict) -> bytes:
         """Formats the request body according to the input schema of
-        the model. Returns bytes or seekable file like object in the
-        format specified in the content_type request header.
+        the model. Returns bytes in the format specified in the
+        content_type request header.
         """
 
     @abstractmethod
@@ -217,8 +278,8 @@ class ContentFormatterBase:
 class GPT2ContentFormatter(ContentFormatterBase):
     """Content handler for LLMs from the OSS catalog."""
 
-    def format_request_payload(self, prompt: str, model_kwargs: Dict) -> str:
-        input_str = json.dumps(
+    def format_request_payload(self, prompt: str, model_kwargs: Dict) -> bytes:
+        input_str = _json_dumps(
             {
                 "inputs": {"input_string": [ContentFormatterBase.escape_special_characters(prompt)]},
                 "parameters": model_kwargs,
@@ -233,8 +294,8 @@ class GPT2ContentFormatter(ContentFormatterBase):
 class HFContentFormatter(ContentFormatterBase):
     """Content handler for LLMs from the HuggingFace catalog."""
 
-    def format_request_payload(self, prompt: str, model_kwargs: Dict) -> str:
-        input_str = json.dumps(
+    def format_request_payload(self, prompt: str, model_kwargs: Dict) -> bytes:
+        input_str = _json_dumps(
             {
                 "inputs": [ContentFormatterBase.escape_special_characters(prompt)],
                 "parameters": model_kwargs,
@@ -249,8 +310,8 @@ class HFContentFormatter(ContentFormatterBase):
 class DollyContentFormatter(ContentFormatterBase):
     """Content handler for the Dolly-v2-12b model"""
 
-    def format_request_payload(self, prompt: str, model_kwargs: Dict) -> str:
-        input_str = json.dumps(
+    def format_request_payload(self, prompt: str, model_kwargs: Dict) -> bytes:
+        input_str = _json_dumps(
             {
                 "input_data": {"input_string": [ContentFormatterBase.escape_special_characters(prompt)]},
                 "parameters": model_kwargs,
@@ -269,30 +330,40 @@ class LlamaContentFormatter(ContentFormatterBase):
         super().__init__()
         self.api = api
         self.chat_history = chat_history
+        self._cached_model_kwargs = None
+        self._params_blob = None
 
-    def format_request_payload(self, prompt: str, model_kwargs: Dict) -> str:
+    def format_request_payload(self, prompt: str, model_kwargs: Dict) -> bytes:
         """Formats the request according the the chosen api"""
-        if "do_sample" not in model_kwargs:
-            model_kwargs["do_sample"] = True
+        # Default do_sample without mutating the caller's dict.
+        params = {"do_sample": True, **model_kwargs}
 
         if self.api == API.CHAT:
             prompt_value = parse_chat(self.chat_history, valid_roles=["assistant", "user", "system"])
         else:
             prompt_value = [ContentFormatterBase.escape_special_characters(prompt)]
 
-        return json.dumps(
-            {
-                "input_data":
-                {
-                    "input_string": prompt_value,
-                    "parameters": model_kwargs
-                }
-            }
-        )
+        # model_kwargs is constant across the rows of a flow; serialize it once
+        # and splice the per-call input_string around the cached blob.
+        if params != self._cached_model_kwargs:
+            self._cached_model_kwargs = params
+            self._params_blob = _json_dumps(params)
+
+        return (b'{"input_data":{"input_string":' + _json_dumps(prompt_value)
+                + b',"parameters":' + self._params_blob + b'}}')
 
     def format_response_payload(self, output: bytes) -> str:
         """Formats response"""
-        response_json = json.loads(output)
+        if simdjson is not None:
+            try:
+                doc = _sj_parser().parse(output)
+                if self.api == API.CHAT:
+                    return doc.at_pointer("/output")
+                return doc.at_pointer("/0/0")
+            except (ValueError, KeyError, IndexError, TypeError):
+                pass
+
+        response_json = _json_loads(output)
 
         if self.api == API.CHAT and "output" in response_json:
             return response_json["output"]
@@ -304,20 +375,28 @@ class LlamaContentFormatter(ContentFormatterBase):
             raise OpenSourceLLMOnlineEndpointError(message=error_message)
 
 
+_FORMATTERS: Dict[ModelFamily, Callable[[API, Any], ContentFormatterBase]] = {
+    ModelFamily.LLAMA: lambda api, chat_history: LlamaContentFormatter(api=api, chat_history=chat_history),
+    ModelFamily.DOLLY: lambda api, chat_history: DollyContentFormatter(),
+    ModelFamily.GPT2: lambda api, chat_history: GPT2ContentFormatter(),
+    ModelFamily.FALCON: lambda api, chat_history: HFContentFormatter(),
+}
+
+
 class ContentFormatterFactory:
     """Factory class for supported models"""
 
+    @staticmethod
     def get_content_formatter(
         model_family: ModelFamily, api: API, chat_history: Optional[List[Dict]] = []
     ) -> ContentFormatterBase:
-        if model_family == ModelFamily.LLAMA:
-            return LlamaContentFormatter(chat_history=chat_history, api=api)
-        elif model_family == ModelFamily.DOLLY:
-            return DollyContentFormatter()
-        elif model_family == ModelFamily.GPT2:
-            return GPT2ContentFormatter()
-        elif model_family == ModelFamily.FALCON:
-            return HFContentFormatter()
+        try:
+            return _FORMATTERS[model_family](api, chat_history)
+        except KeyError:
+            accepted_models = ",".join([model.name for model in ModelFamily])
+            raise OpenSourceLLMUserError(
+                message=f"Given model_family '{model_family}' not recognized. Supported models are: {accepted_models}."
+            )
 
 
 class AzureMLOnlineEndpoint:
@@ -355,6 +434,15 @@ class AzureMLOnlineEndpoint:
         self.model_kwargs = model_kwargs
         self.model_family = model_family
 
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {endpoint_api_key}",
+            "x-ms-user-agent": f"PromptFlow/OpenSourceLLM/{model_family}"}
+
+        # If this is not set it'll use the default deployment on the endpoint.
+        if deployment_name is not None:
+            self._headers["azureml-model-deployment"] = deployment_name
+
     @property
     def _identifying_params(self) -> Mapping[str, Any]:
         """Get the identifying parameters."""
@@ -370,20 +458,27 @@ class AzureMLOnlineEndpoint:
 
     def _call_endpoint(self, body: bytes) -> bytes:
         """call."""
+        response = _SESSION.post(self.endpoint_url, data=body, headers=self._headers, timeout=50)
+        response.raise_for_status()
+        return response.content
+
+    async def _acall_endpoint(self, body: bytes) -> bytes:
+        """Async counterpart of _call_endpoint sharing the per-loop pooled client."""
+        response = await _get_async_client().post(self.endpoint_url, content=body, headers=self._headers)
+        response.raise_for_status()
+        return response.content
+
+    async def acall(self, prompt: str) -> str:
+        """Async counterpart of __call__ for concurrent invocation."""
+        _model_kwargs = self.model_kwargs or {}
 
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": ("Bearer " + self.endpoint_api_key),
-            "x-ms-user-agent": "PromptFlow/OpenSourceLLM/" + self.model_family}
-
-        # If this is not set it'll use the default deployment on the endpoint.
-        if self.deployment_name is not None:
-            headers["azureml-model-deployment"] = self.deployment_name
+        body = self.content_formatter.format_request_payload(prompt, _model_kwargs)
+        endpoint_response = await self._acall_endpoint(body)
+        return self.content_formatter.format_response_payload(endpoint_response)
 
-        req = urllib.request.Request(self.endpoint_url, body, headers)
-        response = urllib.request.urlopen(req, timeout=50)
-        result = response.read()
-        return result
+    async def abatch(self, prompts: List[str]) -> List[str]:
+        """Invoke the endpoint concurrently for a batch of prompts."""
+        return await asyncio.gather(*(self.acall(prompt) for prompt in prompts))
 
     def __call__(
         self,
@@ -401,8 +496,7 @@ class AzureMLOnlineEndpoint:
         _model_kwargs = self.model_kwargs or {}
 
         body = self.content_formatter.format_request_payload(prompt, _model_kwargs)
-        endpoint_request = str.encode(body)
-        endpoint_response = self._call_endpoint(endpoint_request)
+        endpoint_response = self._call_endpoint(body)
         response = self.content_formatter.format_response_payload(endpoint_response)
 
         return response
@@ -443,7 +537,9 @@ class OpenSourceLLM(ToolProvider):
              self.endpoint_key,
              self.model_family) = get_deployment_from_endpoint(self.endpoint_name, self.deployment_name)
 
-        prompt = render_jinja_template(prompt, trim_blocks=True, keep_trailing_newline=True, **kwargs)
+        # Literal prompts need no Jinja pass; a two-byte scan is far cheaper than a render.
+        if "{{" in prompt or "{%" in prompt or "{#" in prompt:
+            prompt = render_jinja_template(prompt, trim_blocks=True, keep_trailing_newline=True, **kwargs)
 
         model_kwargs["top_p"] = top_p
         model_kwargs["temperature"] = temperature
@@ -3,11 +3,38 @@
 # ---------------------------------------------------------
 
 import argparse
+import functools
 
 from promptflow._sdk._constants import CLIListOutputFormat, FlowType
 
 # TODO: avoid azure dependency here
 MAX_LIST_CLI_RESULTS = 50
+_MAX_RESULTS_HELP = f"Max number of results to return. Default is {MAX_LIST_CLI_RESULTS}."
+
+_JSONL_EXT = (".jsonl",)
+
+_load_data = None
+_strip_quotation = None
+
+
+def _get_load_data():
+    """Import load_data once and reuse it across action invocations."""
+    global _load_data
+    if _load_data is None:
+        from promptflow._utils.load_data import load_data
+
+        _load_data = load_data
+    return _load_data
+
+
+def _get_strip_quotation():
+    """Import strip_quotation once and reuse it across action invocations."""
+    global _strip_quotation
+    if _strip_quotation is None:
+        from promptflow._sdk._utils import strip_quotation
+
+        _strip_quotation = strip_quotation
+    return _strip_quotation
 
 
 class AppendToDictAction(argparse._AppendAction):  # pylint: disable=protected-access
@@ -16,231 +43,241 @@ class AppendToDictAction(argparse._AppendAction):  # pylint: disable=protected-a
         super(AppendToDictAction, self).__call__(parser, namespace, action, option_string)
 
     def get_action(self, values, option_string):  # pylint: disable=no-self-use
-        from promptflow._sdk._utils import strip_quotation
+        strip_quotation = _get_strip_quotation()
 
-        kwargs = {}
-        for item in values:
-            try:
-                key, value = strip_quotation(item).split("=", 1)
-                kwargs[key] = strip_quotation(value)
-            except ValueError:
-                raise Exception("Usage error: {} KEY=VALUE [KEY=VALUE ...]".format(option_string))
-        return kwargs
+        def _pairs():
+            for item in values:
+                key, sep, value = strip_quotation(item).partition("=")
+                if not sep:
+                    raise Exception("Usage error: {} KEY=VALUE [KEY=VALUE ...]".format(option_string))
+                yield key, strip_quotation(value)
+
+        # dict() consumes the generator in one C-level pass, sizing the table
+        # from the length hint instead of rehashing as items append.
+        return dict(_pairs())
 
 
 class FlowTestInputAction(AppendToDictAction):  # pylint: disable=protected-access
     def get_action(self, values, option_string):  # pylint: disable=no-self-use
         if len(values) == 1 and "=" not in values[0]:
-            from promptflow._utils.load_data import load_data
-
-            if not values[0].endswith(".jsonl"):
+            if not values[0].endswith(_JSONL_EXT):
                 raise ValueError("Only support jsonl file as input.")
-            return load_data(local_path=values[0])[0]
+            return _get_load_data()(local_path=values[0])[0]
         else:
             return super().get_action(values, option_string)
 
 
-def add_param_yes(parser):
-    parser.add_argument(
-        "-y",
-        "--yes",
-        "--assume-yes",
-        action="store_true",
-        help="Automatic yes to all prompts; assume 'yes' as answer to all prompts and run non-interactively.",
-    )
-
-
-def add_param_flow_display_name(parser):
-    parser.add_argument("--flow", type=str, required=True, help="the flow name to create.")
-
-
-def add_param_entry(parser):
-    parser.add_argument("--entry", type=str, help="the entry file.")
-
-
-def add_param_function(parser):
-    parser.add_argument("--function", type=str, help="the function name in entry file.")
-
-
-def add_param_prompt_template(parser):
-    parser.add_argument(
-        "--prompt-template", action=AppendToDictAction, help="the prompt template parameter and assignment.", nargs="+"
-    )
-
-
-def add_param_set(parser):
-    parser.add_argument(
-        "--set",
-        dest="params_override",
-        action=AppendToDictAction,
-        help="Update an object by specifying a property path and value to set. Example: --set "
-        "property1.property2=<value>.",
-        nargs="+",
-    )
-
-
-def add_param_set_positional(parser):
-    parser.add_argument(
-        "params_override",
-        action=AppendToDictAction,
-        help="Set an object by specifying a property path and value to set. Example: set "
-        "property1.property2=<value>.",
-        nargs="+",
-    )
-
-
-def add_param_environment_variables(parser):
-    parser.add_argument(
-        "--environment-variables",
-        action=AppendToDictAction,
-        help="Environment variables to set by specifying a property path and value. Example: --environment-variable "
-        "key1='${my_connection.api_key}' key2='value2'. The value reference to connection keys will be resolved "
-        "to the actual value, and all environment variables specified will be set into os.environ.",
-        nargs="+",
-    )
-
-
-def add_param_connections(parser):
-    parser.add_argument(
-        "--connections",
-        action=AppendToDictAction,
-        help="Overwrite node level connections with provided value. Example: --connections "
-        "node1.connection=test_llm_connection node1.deployment_name=gpt-35-turbo",
-        nargs="+",
-    )
-
-
-def add_param_columns_mapping(parser):
-    parser.add_argument(
-        "--column-mapping",
-        action=AppendToDictAction,
-        help="Inputs column mapping, use ${data.xx} to refer to data columns, "
-        "use ${run.inputs.xx} to refer to referenced run's data columns. "
-        "and use ${run.outputs.xx} to refer to referenced run's output columns."
-        "Example: --column-mapping data1='${data.data1}' data2='${run.inputs.data2}' data3='${run.outputs.data3}'",
-        nargs="+",
-    )
-
-
-def add_param_set_tool_extra_info(parser):
-    parser.add_argument(
-        "--set",
-        dest="extra_info",
-        action=AppendToDictAction,
-        help="Set extra information about the tool. Example: --set <key>=<value>.",
-        nargs="+",
-    )
-
-
-def add_param_inputs(parser):
-    parser.add_argument(
-        "--inputs",
-        action=FlowTestInputAction,
-        help="Input datas of file for the flow. Example: --inputs data1=data1_val data2=data2_val",
-        nargs="+",
-    )
-
-
-def add_param_input(parser):
-    parser.add_argument(
-        "--input", type=str, required=True, help="the input file path. Note that we accept jsonl file only for now."
-    )
-
-
-def add_param_env(parser):
-    parser.add_argument(
-        "--env",
-        type=str,
-        default=None,
-        help="the dotenv file path containing the environment variables to be used in the flow.",
-    )
-
-
-def add_param_output(parser):
-    parser.add_argument("--output", type=str, default="outputs", help="the output directory to store the results.")
-
-
-def add_param_flow(parser):
-    parser.add_argument("--flow", type=str, required=True, help="the evaluation flow to be used.")
-
-
-def add_param_source(parser):
-    parser.add_argument("--source", type=str, required=True, help="The flow or run source to be used.")
-
-
-def add_param_bulk_run_output(parser):
-    parser.add_argument("--bulk-run-output", type=str, help="the output directory of the bulk run.")
-
-
-def add_param_eval_output(parser):
-    parser.add_argument("--eval-output", type=str, help="the output file path of the evaluation result.")
-
-
-def add_param_column_mapping(parser):
-    parser.add_argument(
-        "--column-mapping", type=str, required=True, help="the column mapping to be used in the evaluation."
-    )
-
-
-def add_param_runtime(parser):
-    parser.add_argument(
-        "--runtime",
-        type=str,
-        default="local",
-        help="Name of your runtime in Azure ML workspace, will run in cloud when runtime is not none.",
-    )
-
-
-def add_param_connection(parser):
-    parser.add_argument("--connection", type=str, help="Name of your connection in Azure ML workspace.")
-
-
-def add_param_run_name(parser):
-    parser.add_argument("-n", "--name", required=True, type=str, help="Name of the run.")
-
-
-def add_param_connection_name(parser):
-    parser.add_argument("-n", "--name", type=str, help="Name of the connection to create.")
-
-
-def add_param_variants(parser):
-    parser.add_argument(
-        "--variants",
-        type=str,
-        nargs="+",
-        help="the variant run ids to be used in the evaluation. Note that we only support one variant for now.",
-        default=[],
-    )
-
-
-def add_param_max_results(parser):
-    parser.add_argument(  # noqa: E731
-        "-r",
-        "--max-results",
-        dest="max_results",
-        type=int,
-        default=MAX_LIST_CLI_RESULTS,
-        help=f"Max number of results to return. Default is {MAX_LIST_CLI_RESULTS}.",
-    )
-
-
-def add_param_all_results(parser):
-    parser.add_argument(  # noqa: E731
-        "--all-results",
-        action="store_true",
-        dest="all_results",
-        default=False,
-        help="Returns all results. Default to False.",
-    )
-
-
-def add_param_variant(parser):
-    parser.add_argument(
-        "--variant",
-        "-v",
-        type=str,
-        help="The variant to be used in flow, will use default variant if not specified.",
-    )
+# Declarative table of argparse parameters: one entry per add_param_* helper,
+# keyed by helper suffix, holding the positional flags and add_argument kwargs.
+_PARAMS = {
+    "yes": (
+        ("-y", "--yes", "--assume-yes"),
+        dict(
+            action="store_true",
+            help="Automatic yes to all prompts; assume 'yes' as answer to all prompts and run non-interactively.",
+        ),
+    ),
+    "flow_display_name": (("--flow",), dict(type=str, required=True, help="the flow name to create.")),
+    "entry": (("--entry",), dict(type=str, help="the entry file.")),
+    "function": (("--function",), dict(type=str, help="the function name in entry file.")),
+    "prompt_template": (
+        ("--prompt-template",),
+        dict(action=AppendToDictAction, help="the prompt template parameter and assignment.", nargs="+"),
+    ),
+    "set": (
+        ("--set",),
+        dict(
+            dest="params_override",
+            action=AppendToDictAction,
+            help="Update an object by specifying a property path and value to set. Example: --set "
+            "property1.property2=<value>.",
+            nargs="+",
+        ),
+    ),
+    "set_positional": (
+        ("params_override",),
+        dict(
+            action=AppendToDictAction,
+            help="Set an object by specifying a property path and value to set. Example: set "
+            "property1.property2=<value>.",
+            nargs="+",
+        ),
+    ),
+    "environment_variables": (
+        ("--environment-variables",),
+        dict(
+            action=AppendToDictAction,
+            help="Environment variables to set by specifying a property path and value. Example: "
+            "--environment-variable key1='${my_connection.api_key}' key2='value2'. The value reference to connection "
+            "keys will be resolved to the actual value, and all environment variables specified will be set into "
+            "os.environ.",
+            nargs="+",
+        ),
+    ),
+    "connections": (
+        ("--connections",),
+        dict(
+            action=AppendToDictAction,
+            help="Overwrite node level connections with provided value. Example: --connections "
+            "node1.connection=test_llm_connection node1.deployment_name=gpt-35-turbo",
+            nargs="+",
+        ),
+    ),
+    "columns_mapping": (
+        ("--column-mapping",),
+        dict(
+            action=AppendToDictAction,
+            help="Inputs column mapping, use ${data.xx} to refer to data columns, "
+            "use ${run.inputs.xx} to refer to referenced run's data columns. "
+            "and use ${run.outputs.xx} to refer to referenced run's output columns."
+            "Example: --column-mapping data1='${data.data1}' data2='${run.inputs.data2}' data3='${run.outputs.data3}'",
+            nargs="+",
+        ),
+    ),
+    "set_tool_extra_info": (
+        ("--set",),
+        dict(
+            dest="extra_info",
+            action=AppendToDictAction,
+            help="Set extra information about the tool. Example: --set <key>=<value>.",
+            nargs="+",
+        ),
+    ),
+    "inputs": (
+        ("--inputs",),
+        dict(
+            action=FlowTestInputAction,
+            help="Input datas of file for the flow. Example: --inputs data1=data1_val data2=data2_val",
+            nargs="+",
+        ),
+    ),
+    "input": (
+        ("--input",),
+        dict(type=str, required=True, help="the input file path. Note that we accept jsonl file only for now."),
+    ),
+    "env": (
+        ("--env",),
+        dict(
+            type=str,
+            default=None,
+            help="the dotenv file path containing the environment variables to be used in the flow.",
+        ),
+    ),
+    "output": (("--output",), dict(type=str, default="outputs", help="the output directory to store the results.")),
+    "flow": (("--flow",), dict(type=str, required=True, help="the evaluation flow to be used.")),
+    "source": (("--source",), dict(type=str, required=True, help="The flow or run source to be used.")),
+    "bulk_run_output": (("--bulk-run-output",), dict(type=str, help="the output directory of the bulk run.")),
+    "eval_output": (("--eval-output",), dict(type=str, help="the output file path of the evaluation result.")),
+    "column_mapping": (
+        ("--column-mapping",),
+        dict(type=str, required=True, help="the column mapping to be used in the evaluation."),
+    ),
+    "runtime": (
+        ("--runtime",),
+        dict(
+            type=str,
+            default="local",
+            help="Name of your runtime in Azure ML workspace, will run in cloud when runtime is not none.",
+        ),
+    ),
+    "connection": (("--connection",), dict(type=str, help="Name of your connection in Azure ML workspace.")),
+    "run_name": (("-n", "--name"), dict(required=True, type=str, help="Name of the run.")),
+    "connection_name": (("-n", "--name"), dict(type=str, help="Name of the connection to create.")),
+    "variants": (
+        ("--variants",),
+        dict(
+            type=str,
+            nargs="+",
+            help="the variant run ids to be used in the evaluation. Note that we only support one variant for now.",
+            default=[],
+        ),
+    ),
+    "max_results": (
+        ("-r", "--max-results"),
+        dict(dest="max_results", type=int, default=MAX_LIST_CLI_RESULTS, help=_MAX_RESULTS_HELP),
+    ),
+    "all_results": (
+        ("--all-results",),
+        dict(action="store_true", dest="all_results", default=False, help="Returns all results. Default to False."),
+    ),
+    "variant": (
+        ("--variant", "-v"),
+        dict(type=str, help="The variant to be used in flow, will use default variant if not specified."),
+    ),
+    "debug": (("-d", "--debug"), dict(action="store_true", help="The flag to turn on debug mode for cli.")),
+    "verbose": (
+        ("--verbose",),
+        dict(action="store_true", help="Increase logging verbosity. Use --debug for full debug logs."),
+    ),
+    "config": (("--config",), dict(nargs="+", action=AppendToDictAction, help=argparse.SUPPRESS)),
+    "archived_only": (("--archived-only",), dict(action="store_true", help="Only list archived records.")),
+    "include_archived": (
+        ("--include-archived",),
+        dict(action="store_true", help="List both archived records and active records."),
+    ),
+    "output_format": (
+        ("-o", "--output"),
+        dict(
+            type=str,
+            default=CLIListOutputFormat.JSON,
+            help="Output format, accepted values are 'json' and 'table'. Default is 'json'.",
+            choices=[CLIListOutputFormat.TABLE, CLIListOutputFormat.JSON],
+        ),
+    ),
+    "include_others": (
+        ("--include-others",),
+        dict(action="store_true", help="Get records that are owned by all users."),
+    ),
+    "flow_name": (("-n", "--name"), dict(type=str, required=True, help="The name of the flow.")),
+}
+
+
+def _make_add_param(name):
+    flags, kwargs = _PARAMS[name]
+
+    def _add_param(parser):
+        parser.add_argument(*flags, **kwargs)
+
+    _add_param.__name__ = f"add_param_{name}"
+    return _add_param
+
+
+add_param_yes = _make_add_param("yes")
+add_param_flow_display_name = _make_add_param("flow_display_name")
+add_param_entry = _make_add_param("entry")
+add_param_function = _make_add_param("function")
+add_param_prompt_template = _make_add_param("prompt_template")
+add_param_set = _make_add_param("set")
+add_param_set_positional = _make_add_param("set_positional")
+add_param_environment_variables = _make_add_param("environment_variables")
+add_param_connections = _make_add_param("connections")
+add_param_columns_mapping = _make_add_param("columns_mapping")
+add_param_set_tool_extra_info = _make_add_param("set_tool_extra_info")
+add_param_inputs = _make_add_param("inputs")
+add_param_input = _make_add_param("input")
+add_param_env = _make_add_param("env")
+add_param_output = _make_add_param("output")
+add_param_flow = _make_add_param("flow")
+add_param_source = _make_add_param("source")
+add_param_bulk_run_output = _make_add_param("bulk_run_output")
+add_param_eval_output = _make_add_param("eval_output")
+add_param_column_mapping = _make_add_param("column_mapping")
+add_param_runtime = _make_add_param("runtime")
+add_param_connection = _make_add_param("connection")
+add_param_run_name = _make_add_param("run_name")
+add_param_connection_name = _make_add_param("connection_name")
+add_param_variants = _make_add_param("variants")
+add_param_max_results = _make_add_param("max_results")
+add_param_all_results = _make_add_param("all_results")
+add_param_variant = _make_add_param("variant")
+add_param_debug = _make_add_param("debug")
+add_param_verbose = _make_add_param("verbose")
+add_param_config = _make_add_param("config")
+add_param_archived_only = _make_add_param("archived_only")
+add_param_include_archived = _make_add_param("include_archived")
+add_param_output_format = _make_add_param("output_format")
+add_param_include_others = _make_add_param("include_others")
+add_param_flow_name = _make_add_param("flow_name")
 
 
 def add_parser_build(parent_parser, entity_name: str):
@@ -266,67 +303,14 @@ def add_parser_build(parent_parser, entity_name: str):
     parser.set_defaults(sub_action="build")
 
 
-def add_param_debug(parser):
-    parser.add_argument(
-        "-d",
-        "--debug",
-        action="store_true",
-        help="The flag to turn on debug mode for cli.",
-    )
-
-
-def add_param_verbose(parser):
-    parser.add_argument(
-        "--verbose",
-        action="store_true",
-        help="Increase logging verbosity. Use --debug for full debug logs.",
-    )
-
-
-def add_param_config(parser):
-    parser.add_argument(
-        "--config",
-        nargs="+",
-        action=AppendToDictAction,
-        help=argparse.SUPPRESS,
-    )
-
-
 logging_params = [add_param_verbose, add_param_debug]
 
 
-def add_param_archived_only(parser):
-    parser.add_argument(
-        "--archived-only",
-        action="store_true",
-        help="Only list archived records.",
-    )
-
-
-def add_param_include_archived(parser):
-    parser.add_argument(
-        "--include-archived",
-        action="store_true",
-        help="List both archived records and active records.",
-    )
-
-
-def add_param_output_format(parser):
-    parser.add_argument(
-        "-o",
-        "--output",
-        type=str,
-        default=CLIListOutputFormat.JSON,
-        help="Output format, accepted values are 'json' and 'table'. Default is 'json'.",
-        choices=[CLIListOutputFormat.TABLE, CLIListOutputFormat.JSON],
-    )
-
-
-def add_param_include_others(parser):
-    parser.add_argument(
-        "--include-others",
-        action="store_true",
-        help="Get records that are owned by all users.",
+@functools.lru_cache(maxsize=1)
+def _flow_type_help():
+    return (
+        f"The type of the flow. Available values are {FlowType.get_all_values()}. "
+        f"Default to be None, which means all types included."
     )
 
 
@@ -334,18 +318,5 @@ def add_param_flow_type(parser):
     parser.add_argument(
         "--type",
         type=str,
-        help=(
-            f"The type of the flow. Available values are {FlowType.get_all_values()}. "
-            f"Default to be None, which means all types included."
-        ),
-    )
-
-
-def add_param_flow_name(parser):
-    parser.add_argument(
-        "-n",
-        "--name",
-        type=str,
-        required=True,
-        help="The name of the flow.",
+        help=_flow_type_help(),
     )
@@ -3,12 +3,14 @@
 # ---------------------------------------------------------
 
 import argparse
-import importlib
+import importlib.util
 import json
 import logging
 import os
+import shutil
+import stat
+import sys
 import tempfile
-import webbrowser
 from pathlib import Path
 
 from promptflow._cli._params import (
@@ -24,25 +26,44 @@ from promptflow._cli._params import (
     add_parser_build,
     logging_params,
 )
-from promptflow._cli._pf._init_entry_generators import (
-    AzureOpenAIConnectionGenerator,
-    ChatFlowDAGGenerator,
-    FlowDAGGenerator,
-    OpenAIConnectionGenerator,
-    StreamlitFileGenerator,
-    ToolMetaGenerator,
-    ToolPyGenerator,
-    copy_extra_files,
-)
 from promptflow._cli._pf._run import exception_handler
-from promptflow._cli._utils import _copy_to_flow, activate_action, confirm, inject_sys_path, list_of_dict_to_dict
+from promptflow._cli._utils import activate_action, confirm, inject_sys_path, list_of_dict_to_dict
 from promptflow._sdk._constants import LOGGER_NAME, PROMPT_FLOW_DIR_NAME, ConnectionProvider
-from promptflow._sdk._pf_client import PFClient
 
 DEFAULT_CONNECTION = "open_ai_connection"
 DEFAULT_DEPLOYMENT = "gpt-35-turbo"
+_DATA_ROOT = Path(__file__).resolve().parent.parent / "data"
 logger = logging.getLogger(LOGGER_NAME)
 
+_pf_client = None
+_entry_modules = {}
+
+
+def _get_pf_client():
+    """Reuse one default PFClient across commands in the same process."""
+    global _pf_client
+    if _pf_client is None:
+        from promptflow._sdk._pf_client import PFClient
+
+        _pf_client = PFClient()
+    return _pf_client
+
+
+def _load_entry_module(entry: Path, flow_path: Path):
+    """Load the entry file from its location directly, bypassing the finder
+    scan and the sys.path mutation import_module would need. sys.path is only
+    injected around exec_module for imports inside the entry file itself."""
+    cached = _entry_modules.get(str(entry))
+    if cached is not None:
+        return cached
+    spec = importlib.util.spec_from_file_location(entry.stem, entry)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[entry.stem] = module
+    with inject_sys_path(flow_path):
+        spec.loader.exec_module(module)
+    _entry_modules[str(entry)] = module
+    return module
+
 
 def add_flow_parser(subparsers):
     """Add flow parser to the pf subparsers."""
@@ -52,30 +73,48 @@ def add_flow_parser(subparsers):
         help="pf flow",
     )
     flow_subparsers = flow_parser.add_subparsers()
-    add_parser_init_flow(flow_subparsers)
-    add_parser_test_flow(flow_subparsers)
-    add_parser_serve_flow(flow_subparsers)
-    add_parser_build(flow_subparsers, "flow")
-    add_parser_validate_flow(flow_subparsers)
+    registrars = {
+        "init": add_parser_init_flow,
+        "test": add_parser_test_flow,
+        "serve": add_parser_serve_flow,
+        "build": lambda sp: add_parser_build(sp, "flow"),
+        "validate": add_parser_validate_flow,
+    }
+    sub_action = _sniff_sub_action(registrars) if os.environ.get("PF_LAZY_SUBPARSERS") == "1" else None
+    if sub_action is not None:
+        registrars[sub_action](flow_subparsers)
+    else:
+        for registrar in registrars.values():
+            registrar(flow_subparsers)
     flow_parser.set_defaults(action="flow")
 
 
+def _sniff_sub_action(registrars):
+    """Identify the requested flow sub-action from argv so only its subparser
+    needs to be built. Returns None (register everything) for help requests or
+    anything unrecognized, preserving the full help listing."""
+    try:
+        index = sys.argv.index("flow")
+    except ValueError:
+        return None
+    for arg in sys.argv[index + 1:]:
+        if arg in ("-h", "--help"):
+            return None
+        if not arg.startswith("-"):
+            return arg if arg in registrars else None
+    return None
+
+
 def dispatch_flow_commands(args: argparse.Namespace):
-    if args.sub_action == "init":
-        init_flow(args)
-    elif args.sub_action == "test":
-        test_flow(args)
-    elif args.sub_action == "serve":
-        if (hasattr(args, "verbose") and args.verbose) or (hasattr(args, "debug") and args.debug):
-            pass
-        else:
-            for handler in logging.getLogger(LOGGER_NAME).handlers:
-                handler.setLevel(logging.INFO)
-        serve_flow(args)
-    elif args.sub_action == "build":
-        build_flow(args)
-    elif args.sub_action == "validate":
-        validate_flow(args)
+    _DISPATCH[args.sub_action](args)
+
+
+def _serve_flow_with_log_level(args):
+    verbose = getattr(args, "verbose", False) or getattr(args, "debug", False)
+    if not verbose:
+        for handler in logger.handlers:
+            handler.setLevel(logging.INFO)
+    serve_flow(args)
 
 
 def add_parser_init_flow(subparsers):
@@ -244,10 +283,7 @@ pf flow test --flow my-awesome-flow --node node_name --interactive
 def init_flow(args):
     if any([args.entry, args.prompt_template]):
         print("Creating flow from existing folder...")
-        prompt_tpl = {}
-        if args.prompt_template:
-            for _dct in args.prompt_template:
-                prompt_tpl.update(**_dct)
+        prompt_tpl = {k: v for _dct in args.prompt_template or [] for k, v in _dct.items()}
         _init_existing_flow(args.flow, args.entry, args.function, prompt_tpl)
     else:
         # Create an example flow
@@ -256,49 +292,62 @@ def init_flow(args):
 
 
 def _init_existing_flow(flow_name, entry=None, function=None, prompt_params: dict = None):
+    from promptflow._cli._pf._init_entry_generators import (
+        FlowDAGGenerator,
+        ToolMetaGenerator,
+        ToolPyGenerator,
+        copy_extra_files,
+    )
+
     flow_path = Path(flow_name).resolve()
     if not function:
         logger.error("--function must be specified when --entry is specified.")
         return
     if not flow_path.exists():
-        logger.error(f"{flow_path.resolve()} must exist when --entry specified.")
+        logger.error(f"{flow_path} must exist when --entry specified.")
         return
-    print(f"Change working directory to .. {flow_path.resolve()}")
-    os.chdir(flow_path)
-    entry = Path(entry).resolve()
+    entry = (flow_path / entry).resolve()
     if not entry.exists():
         logger.error(f"{entry} must exist.")
         return
-    with inject_sys_path(flow_path):
-        # import function object
-        function_obj = getattr(importlib.import_module(entry.stem), function)
+    # import function object
+    function_obj = getattr(_load_entry_module(entry, flow_path), function)
     # Create tool.py
     tool_py = f"{function}_tool.py"
     python_tool = ToolPyGenerator(entry, function, function_obj)
-    tools = ToolMetaGenerator(tool_py, function, function_obj, prompt_params)
+    tools = ToolMetaGenerator(tool_py, function, function_obj, prompt_params, working_dir=flow_path)
 
     python_tool_inputs = [arg.name for arg in python_tool.tool_arg_list]
     for tool_input in tools.prompt_params.keys():
         if tool_input not in python_tool_inputs:
             raise ValueError(f"Template parameter {tool_input} doesn't find in python function arguments.")
 
-    python_tool.generate_to_file(tool_py)
+    python_tool.generate_to_file(flow_path / tool_py)
     # Create .promptflow and flow.tools.json
     meta_dir = flow_path / PROMPT_FLOW_DIR_NAME
     meta_dir.mkdir(parents=True, exist_ok=True)
     tools.generate_to_file(meta_dir / "flow.tools.json")
     # Create flow.dag.yaml
-    FlowDAGGenerator(tool_py, function, function_obj, prompt_params).generate_to_file("flow.dag.yaml")
+    FlowDAGGenerator(tool_py, function, function_obj, prompt_params, working_dir=flow_path).generate_to_file(
+        flow_path / "flow.dag.yaml"
+    )
     copy_extra_files(flow_path=flow_path, extra_files=["requirements.txt", ".gitignore"])
-    print(f"Done. Generated flow in folder: {flow_path.resolve()}.")
+    print(f"Done. Generated flow in folder: {flow_path}.")
 
 
 def _init_chat_flow(flow_name, flow_path, connection=None, deployment=None):
+    from promptflow._cli._pf._init_entry_generators import (
+        AzureOpenAIConnectionGenerator,
+        ChatFlowDAGGenerator,
+        OpenAIConnectionGenerator,
+        copy_extra_files,
+    )
     from promptflow._sdk._configuration import Configuration
 
-    example_flow_path = Path(__file__).parent.parent / "data" / "chat_flow" / "flow_files"
-    for item in list(example_flow_path.iterdir()):
-        _copy_to_flow(flow_path=flow_path, source_file=item)
+    flow_path = Path(flow_path).resolve()
+    example_flow_path = _DATA_ROOT / "chat_flow" / "flow_files"
+    print(f"Copying flow files to {flow_path}...")
+    shutil.copytree(example_flow_path, flow_path, dirs_exist_ok=True)
 
     # Generate flow.dag.yaml to chat flow.
     connection = connection or DEFAULT_CONNECTION
@@ -312,7 +361,7 @@ def _init_chat_flow(flow_name, flow_path, connection=None, deployment=None):
 
     copy_extra_files(flow_path=flow_path, extra_files=["requirements.txt", ".gitignore"])
 
-    print(f"Done. Created chat flow folder: {flow_path.resolve()}.")
+    print(f"Done. Created chat flow folder: {flow_path}.")
     if is_local_connection:
         print(
             f"The generated chat flow is requiring a connection named {connection}, "
@@ -328,42 +377,62 @@ def _init_chat_flow(flow_name, flow_path, connection=None, deployment=None):
 
 
 def _init_standard_or_evaluation_flow(flow_name, flow_path, flow_type):
-    example_flow_path = Path(__file__).parent.parent / "data" / f"{flow_type}_flow"
-    for item in list(example_flow_path.iterdir()):
-        _copy_to_flow(flow_path=flow_path, source_file=item)
+    from promptflow._cli._pf._init_entry_generators import copy_extra_files
+
+    flow_path = Path(flow_path).resolve()
+    example_flow_path = _DATA_ROOT / f"{flow_type}_flow"
+    print(f"Copying flow files to {flow_path}...")
+    shutil.copytree(example_flow_path, flow_path, dirs_exist_ok=True)
     copy_extra_files(flow_path=flow_path, extra_files=["requirements.txt", ".gitignore"])
-    print(f"Done. Created {flow_type} flow folder: {flow_path.resolve()}.")
+    print(f"Done. Created {flow_type} flow folder: {flow_path}.")
     flow_test_command = f"pf flow test --flow {flow_name} --input {os.path.join(flow_name, 'data.jsonl')}"
     print(f"You can execute this command to test the flow, {flow_test_command}")
 
 
 def _init_flow_by_template(flow_name, flow_type, overwrite=False, connection=None, deployment=None):
     flow_path = Path(flow_name)
-    if flow_path.exists():
-        if not flow_path.is_dir():
+    # One stat covers both the exists() and is_dir() probes.
+    try:
+        flow_path_stat = os.stat(flow_path)
+    except FileNotFoundError:
+        flow_path_stat = None
+    if flow_path_stat is not None:
+        if not stat.S_ISDIR(flow_path_stat.st_mode):
             logger.error(f"{flow_path.resolve()} is not a folder.")
             return
-        answer = (
-            overwrite
-            if overwrite
-            else confirm("The flow folder already exists, do you want to create the flow in this existing folder?")
-        )
-        if not answer:
+        if not overwrite and not confirm(
+            "The flow folder already exists, do you want to create the flow in this existing folder?"
+        ):
             print("The 'pf init' command has been cancelled.")
             return
-    flow_path.mkdir(parents=True, exist_ok=True)
+    else:
+        flow_path.mkdir(parents=True, exist_ok=True)
     if flow_type == "chat":
         _init_chat_flow(flow_name=flow_name, flow_path=flow_path, connection=connection, deployment=deployment)
     else:
         _init_standard_or_evaluation_flow(flow_name=flow_name, flow_path=flow_path, flow_type=flow_type)
 
 
+def _dump_result(result: dict):
+    """Write the test result to stdout without building one large string."""
+    try:
+        import orjson
+
+        sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.flush()
+    except ImportError:
+        json.dump(result, sys.stdout, indent=4, ensure_ascii=False)
+        sys.stdout.write("\n")
+
+
 @exception_handler("Flow test")
 def test_flow(args):
     from promptflow._sdk._load_functions import load_flow
+    from promptflow._sdk._pf_client import PFClient
 
     config = list_of_dict_to_dict(args.config)
-    pf_client = PFClient(config=config)
+    pf_client = PFClient(config=config) if config else _get_pf_client()
 
     if args.environment_variables:
         environment_variables = list_of_dict_to_dict(args.environment_variables)
@@ -371,15 +440,19 @@ def test_flow(args):
         environment_variables = {}
     inputs = {}
     if args.input:
-        from promptflow._utils.load_data import load_data
+        from promptflow._cli._params import _JSONL_EXT, _get_load_data
 
-        if args.input and not args.input.endswith(".jsonl"):
+        if not args.input.endswith(_JSONL_EXT):
             raise ValueError("Only support jsonl file as input.")
-        inputs = load_data(local_path=args.input)[0]
+        inputs = _get_load_data()(local_path=args.input)[0]
     if args.inputs:
         inputs.update(list_of_dict_to_dict(args.inputs))
 
     if args.multi_modal or args.ui:
+        from concurrent.futures import ThreadPoolExecutor
+
+        from promptflow._cli._pf._init_entry_generators import StreamlitFileGenerator
+
         with tempfile.TemporaryDirectory() as temp_dir:
             flow = load_flow(args.flow)
 
@@ -388,12 +461,14 @@ def test_flow(args):
                 os.path.join(temp_dir, "utils.py"),
                 os.path.join(temp_dir, "logo.png"),
             ]
-            for script in script_path:
-                StreamlitFileGenerator(
-                    flow_name=flow.name,
-                    flow_dag_path=flow.flow_dag_path,
-                    connection_provider=pf_client._ensure_connection_provider(),
-                ).generate_to_file(script)
+            generator = StreamlitFileGenerator(
+                flow_name=flow.name,
+                flow_dag_path=flow.flow_dag_path,
+                connection_provider=pf_client._ensure_connection_provider(),
+            )
+            # The three writes are independent; overlap their disk I/O.
+            with ThreadPoolExecutor(max_workers=len(script_path)) as executor:
+                list(executor.map(generator.generate_to_file, script_path))
             main_script_path = os.path.join(temp_dir, "main.py")
             pf_client.flows._chat_with_ui(script=main_script_path)
     else:
@@ -418,7 +493,7 @@ def test_flow(args):
             )
             # Print flow/node test result
             if isinstance(result, dict):
-                print(json.dumps(result, indent=4, ensure_ascii=False))
+                _dump_result(result)
             else:
                 print(result)
 
@@ -426,8 +501,8 @@ def test_flow(args):
 def serve_flow(args):
     logger.info("Start serve model: %s", args.source)
     # Set environment variable for local test
-    source = Path(args.source)
-    os.environ["PROMPTFLOW_PROJECT_PATH"] = source.absolute().as_posix()
+    source = Path(args.source).absolute()
+    os.environ["PROMPTFLOW_PROJECT_PATH"] = source.as_posix()
     from promptflow._sdk._serving.app import create_app
 
     static_folder = args.static_folder
@@ -438,9 +513,6 @@ def serve_flow(args):
         args.port,
     )
     config = list_of_dict_to_dict(args.config)
-    # Change working directory to model dir
-    print(f"Change working directory to model dir {source}")
-    os.chdir(source)
     app = create_app(
         static_folder=static_folder,
         environment_variables=list_of_dict_to_dict(args.environment_variables),
@@ -448,6 +520,8 @@ def serve_flow(args):
     )
     target = f"http://{args.host}:{args.port}"
     print(f"Opening browser {target}...")
+    import webbrowser
+
     webbrowser.open(target)
     # Debug is not supported for now as debug will rerun command, and we changed working directory.
     app.run(port=args.port, host=args.host)
@@ -471,7 +545,7 @@ def build_flow(args):
     Dockerfile|executable.exe
     ...
     """
-    pf_client = PFClient()
+    pf_client = _get_pf_client()
 
     pf_client.flows.build(
         flow=args.source,
@@ -480,15 +554,16 @@ def build_flow(args):
         variant=args.variant,
         flow_only=args.flow_only,
     )
+    output_path = Path(args.output).absolute()
     print(
-        f"Exported flow to {Path(args.output).absolute().as_posix()}.\n"
-        f"please check {Path(args.output).joinpath('README.md').absolute().as_posix()} "
+        f"Exported flow to {output_path.as_posix()}.\n"
+        f"please check {output_path.joinpath('README.md').as_posix()} "
         f"for how to use it."
     )
 
 
 def validate_flow(args):
-    pf_client = PFClient()
+    pf_client = _get_pf_client()
 
     validation_result = pf_client.flows.validate(
         flow=args.source,
@@ -498,3 +573,12 @@ def validate_flow(args):
         exit(1)
     else:
         exit(0)
+
+
+_DISPATCH = {
+    "init": init_flow,
+    "test": test_flow,
+    "serve": _serve_flow_with_log_level,
+    "build": build_flow,
+    "validate": validate_flow,
+}
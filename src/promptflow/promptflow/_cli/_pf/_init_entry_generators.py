@@ -2,17 +2,20 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # ---------------------------------------------------------
 
+import functools
 import inspect
 import logging
+import os
 import shutil
+import sys
 from abc import ABC, abstractmethod
 from ast import literal_eval
 from enum import Enum
 from pathlib import Path
 
-from jinja2 import Environment, Template, meta
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, PrefixLoader, Template, meta
 
-from promptflow._sdk._constants import LOGGER_NAME
+from promptflow._sdk._constants import HOME_PROMPT_FLOW_DIR, LOGGER_NAME
 from promptflow._sdk.operations._flow_operations import FlowOperations
 from promptflow.contracts.flow import Flow as ExecutableFlow
 from promptflow.exceptions import UserErrorException
@@ -25,6 +28,86 @@ EXTRA_FILES_MAPPING = {"requirements.txt": "requirements_txt", ".gitignore": "gi
 SERVE_TEMPLATE_PATH = Path(__file__).resolve().parent.parent.parent / "_sdk" / "data" / "executable"
 
 
+@functools.lru_cache(maxsize=128)
+def _cached_signature(func):
+    """Resolve a function signature once; several generators inspect the same entry function."""
+    return inspect.signature(func)
+
+
+# Shared environment for extracting undeclared variables from prompt files;
+# building an Environment per file re-initializes the lexer for nothing.
+_META_ENV = Environment()
+
+
+@functools.lru_cache(maxsize=128)
+def _read_prompt_file(file_path, mtime, size):
+    """Read a prompt file once per (path, stat); both meta and DAG generators consume the same files."""
+    with open(file_path, "r") as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=128)
+def _undeclared_variables(file_path, mtime, size):
+    """Parse a prompt file and return its undeclared variables, cached by path and stat."""
+    ast = _META_ENV.parse(_read_prompt_file(file_path, mtime, size))
+    return frozenset(meta.find_undeclared_variables(ast))
+
+
+@functools.lru_cache(maxsize=16)
+def _load_chat_executable(flow_dag_path, mtime):
+    """Parse the flow DAG and run the chat-flow check once per (path, mtime)."""
+    path = Path(flow_dag_path)
+    executable = ExecutableFlow.from_yaml(flow_file=Path(path.name), working_dir=path.parent)
+    return executable, FlowOperations._is_chat_flow(executable)
+
+
+# Template roots the generators read from; the same file name can exist under
+# several roots, so the loader namespaces them by prefix.
+_TEMPLATE_ROOTS = {
+    "entry_flow": TEMPLATE_PATH,
+    "chat_flow": CHAT_FLOW_TEMPLATE_PATH,
+    "package_tool": TOOL_TEMPLATE_PATH,
+    "executable": SERVE_TEMPLATE_PATH,
+}
+
+
+def _make_template_env() -> Environment:
+    # Persist compiled template bytecode under the promptflow home dir so warm
+    # pf invocations skip template compilation entirely.
+    try:
+        bytecode_dir = HOME_PROMPT_FLOW_DIR / ".template_cache"
+        bytecode_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(directory=str(bytecode_dir))
+    except OSError:
+        bytecode_cache = None
+    return Environment(
+        loader=PrefixLoader({prefix: FileSystemLoader(str(root)) for prefix, root in _TEMPLATE_ROOTS.items()}),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=bytecode_cache,
+        # Templates are package data; skip per-render mtime checks.
+        auto_reload=False,
+    )
+
+
+_TEMPLATE_ENV = _make_template_env()
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_template(tpl_file) -> Template:
+    """Compile a template file once per process; templates are package data and never change at runtime."""
+    path = Path(tpl_file)
+    for prefix, root in _TEMPLATE_ROOTS.items():
+        try:
+            rel = path.relative_to(root)
+        except ValueError:
+            continue
+        return _TEMPLATE_ENV.get_template(f"{prefix}/{rel.as_posix()}")
+    # Paths outside the known roots still compile directly.
+    with open(tpl_file) as f:
+        return Template(f.read(), trim_blocks=True, lstrip_blocks=True)
+
+
 class BaseGenerator(ABC):
     @property
     @abstractmethod
@@ -38,19 +121,23 @@ class BaseGenerator(ABC):
 
     def generate(self) -> str:
         """Generate content based on given template and actual value of template keys."""
-        with open(self.tpl_file) as f:
-            entry_template = f.read()
-            entry_template = Template(entry_template, trim_blocks=True, lstrip_blocks=True)
-
+        entry_template = _compile_template(self.tpl_file)
         return entry_template.render(**{key: getattr(self, key) for key in self.entry_template_keys})
 
+    def _dump(self, f):
+        """Stream generated content into an open binary file without building the full string."""
+        entry_template = _compile_template(self.tpl_file)
+        stream = entry_template.stream(**{key: getattr(self, key) for key in self.entry_template_keys})
+        stream.dump(f, encoding="utf-8")
+
     def generate_to_file(self, target):
         """Generate content to a file based on given template and actual value of template keys."""
         target = Path(target).resolve()
         action = "Overwriting" if target.exists() else "Creating"
-        print(f"{action} {target.resolve()}...")
-        with open(target, "w", encoding="utf-8") as f:
-            f.write(self.generate())
+        # A single write emits message and newline in one call, unlike print.
+        sys.stdout.write(f"{action} {target}...\n")
+        with open(target, "wb") as f:
+            self._dump(f)
 
 
 class ToolPyGenerator(BaseGenerator):
@@ -59,15 +146,13 @@ class ToolPyGenerator(BaseGenerator):
         self.entry_function = function
         self.tool_function = f"{function}_tool"
         # TODO: support default for tool args
-        self.tool_arg_list = inspect.signature(function_obj).parameters.values()
+        self.tool_arg_list = _cached_signature(function_obj).parameters.values()
 
     @property
     def tpl_file(self):
         return TEMPLATE_PATH / "tool.py.jinja2"
 
-    @property
-    def entry_template_keys(self):
-        return ["function_import", "entry_function", "tool_function", "tool_arg_list"]
+    entry_template_keys = ("function_import", "entry_function", "tool_function", "tool_arg_list")
 
 
 class ValueType(str, Enum):
@@ -80,26 +165,26 @@ class ValueType(str, Enum):
 
     @staticmethod
     def from_type(t: type):
-        if t == int:
-            return ValueType.INT
-        if t == float:
-            return ValueType.DOUBLE
-        if t == bool:
-            return ValueType.BOOL
-        if t == str:
-            return ValueType.STRING
-        if t == list:
-            return ValueType.LIST
-        return ValueType.OBJECT
+        return _VALUE_TYPE_MAP.get(t, ValueType.OBJECT)
+
+
+_VALUE_TYPE_MAP = {
+    int: ValueType.INT,
+    float: ValueType.DOUBLE,
+    bool: ValueType.BOOL,
+    str: ValueType.STRING,
+    list: ValueType.LIST,
+}
 
 
 class ToolMetaGenerator(BaseGenerator):
-    def __init__(self, tool_py, function, function_obj, prompt_params):
+    def __init__(self, tool_py, function, function_obj, prompt_params, working_dir=None):
         self.tool_file = tool_py
         self.tool_function = f"{function}_tool"
         # TODO: support default for tool meta args
         self.tool_meta_args = self.get_tool_meta_args(function_obj)
         self._prompt_params = prompt_params
+        self._working_dir = Path(working_dir) if working_dir else Path.cwd()
 
     @property
     def prompt_params(self):
@@ -107,22 +192,24 @@ class ToolMetaGenerator(BaseGenerator):
 
         prompt_objs = {}
         for key, file_name in self._prompt_params.items():
-            file_path = Path(file_name)
+            # Resolve against the flow directory, but keep the relative name in
+            # the generated meta.
+            file_path = self._working_dir / file_name
             if not file_path.exists():
                 logger.warning(
                     f'Cannot find the prompt template "{file_name}", creating an empty prompt file in the flow...'
                 )
-                with open(file_path, "w") as f:
-                    f.write("{# please enter your prompt content in this file. #}")
+                with open(file_path, "wb") as f:
+                    f.write(b"{# please enter your prompt content in this file. #}")
 
-            with open(file_name, "r") as f:
-                content = f.read()
+            file_stat = file_path.stat()
+            content = _read_prompt_file(str(file_path), file_stat.st_mtime_ns, file_stat.st_size)
             name = Path(file_name).stem
             prompt_objs[key] = generate_prompt_meta_dict(name, content, prompt_only=True, source=file_name)
         return prompt_objs
 
     def get_tool_meta_args(self, function_obj):
-        func_params = inspect.signature(function_obj).parameters
+        func_params = _cached_signature(function_obj).parameters
         # TODO: Support enum/union in the future
         return {k: ValueType.from_type(v.annotation).value for k, v in func_params.items()}
 
@@ -130,13 +217,11 @@ class ToolMetaGenerator(BaseGenerator):
     def tpl_file(self):
         return TEMPLATE_PATH / "flow.tools.json.jinja2"
 
-    @property
-    def entry_template_keys(self):
-        return ["prompt_params", "tool_file", "tool_meta_args", "tool_function"]
+    entry_template_keys = ("prompt_params", "tool_file", "tool_meta_args", "tool_function")
 
 
 class FlowDAGGenerator(BaseGenerator):
-    def __init__(self, tool_py, function, function_obj, prompt_params):
+    def __init__(self, tool_py, function, function_obj, prompt_params, working_dir=None):
         self.tool_file = tool_py
         self.main_node_name = function
         self.prompt_params = prompt_params
@@ -145,6 +230,7 @@ class FlowDAGGenerator(BaseGenerator):
         self._prompt_inputs = None
         self._func_params = None
         self._function_obj = function_obj
+        self._working_dir = Path(working_dir) if working_dir else Path.cwd()
         # Abstract prompt param from tool meta args
         self.flow_inputs = self.get_flow_inputs(prompt_params)
 
@@ -166,7 +252,7 @@ class FlowDAGGenerator(BaseGenerator):
         """Generate function inputs without prompt templates."""
         if self._func_params is None:
             self._func_params = {
-                k: v for k, v in inspect.signature(self._function_obj).parameters.items() if k not in self.prompt_params
+                k: v for k, v in _cached_signature(self._function_obj).parameters.items() if k not in self.prompt_params
             }
         return self._func_params
 
@@ -177,27 +263,24 @@ class FlowDAGGenerator(BaseGenerator):
             self._prompt_inputs = {}
             for prompt_name, file_name in self.prompt_params.items():
                 try:
-                    with open(file_name, "r") as f:
-                        env = Environment()
-                        ast = env.parse(f.read())
-                        variables = meta.find_undeclared_variables(ast)
-                        self._prompt_inputs[prompt_name] = {item: "string" for item in variables or []}
+                    file_path = self._working_dir / file_name
+                    file_stat = file_path.stat()
+                    variables = _undeclared_variables(str(file_path), file_stat.st_mtime_ns, file_stat.st_size)
+                    self._prompt_inputs[prompt_name] = {item: "string" for item in variables}
                 except Exception as e:
                     logger.warning(f"Get the prompt input from {file_name} failed, {e}.")
         return self._prompt_inputs
 
-    @property
-    def entry_template_keys(self):
-        return [
-            "flow_inputs",
-            "main_node_name",
-            "prompt_params",
-            "tool_file",
-            "setup_sh",
-            "python_requirements_txt",
-            "prompt_inputs",
-            "func_params",
-        ]
+    entry_template_keys = (
+        "flow_inputs",
+        "main_node_name",
+        "prompt_params",
+        "tool_file",
+        "setup_sh",
+        "python_requirements_txt",
+        "prompt_inputs",
+        "func_params",
+    )
 
     def generate_to_file(self, target):
         # Get requirements.txt and setup.sh from target folder.
@@ -218,9 +301,7 @@ class FlowMetaYamlGenerator(BaseGenerator):
     def tpl_file(self):
         return TEMPLATE_PATH / "flow.meta.yaml.jinja2"
 
-    @property
-    def entry_template_keys(self):
-        return ["flow_name"]
+    entry_template_keys = ("flow_name",)
 
 
 class StreamlitFileGenerator(BaseGenerator):
@@ -228,10 +309,10 @@ class StreamlitFileGenerator(BaseGenerator):
         self.flow_name = flow_name
         self.flow_dag_path = Path(flow_dag_path)
         self.connection_provider = connection_provider
-        self.executable = ExecutableFlow.from_yaml(
-            flow_file=Path(self.flow_dag_path.name), working_dir=self.flow_dag_path.parent
+        self.executable, chat_flow_check = _load_chat_executable(
+            str(self.flow_dag_path), self.flow_dag_path.stat().st_mtime_ns
         )
-        self.is_chat_flow, self.chat_history_input_name, error_msg = FlowOperations._is_chat_flow(self.executable)
+        self.is_chat_flow, self.chat_history_input_name, error_msg = chat_flow_check
         if not self.is_chat_flow:
             raise UserErrorException(f"Only support chat flow in ui mode, {error_msg}.")
         self._chat_input_name = next(
@@ -267,20 +348,18 @@ class StreamlitFileGenerator(BaseGenerator):
     def flow_path(self):
         return self.flow_dag_path.as_posix()
 
-    @property
-    def entry_template_keys(self):
-        return [
-            "flow_name",
-            "chat_input_name",
-            "flow_inputs_params",
-            "flow_path",
-            "is_chat_flow",
-            "chat_history_input_name",
-            "connection_provider",
-            "chat_input_default_value",
-            "chat_input_value_type",
-            "chat_input_name",
-        ]
+    entry_template_keys = (
+        "flow_name",
+        "chat_input_name",
+        "flow_inputs_params",
+        "flow_path",
+        "is_chat_flow",
+        "chat_history_input_name",
+        "connection_provider",
+        "chat_input_default_value",
+        "chat_input_value_type",
+        "chat_input_name",
+    )
 
     def generate_to_file(self, target):
         if Path(target).name == "main.py":
@@ -298,9 +377,7 @@ class ChatFlowDAGGenerator(BaseGenerator):
     def tpl_file(self):
         return CHAT_FLOW_TEMPLATE_PATH / "flow.dag.yaml.jinja2"
 
-    @property
-    def entry_template_keys(self):
-        return ["connection", "deployment"]
+    entry_template_keys = ("connection", "deployment")
 
 
 class AzureOpenAIConnectionGenerator(BaseGenerator):
@@ -311,9 +388,7 @@ class AzureOpenAIConnectionGenerator(BaseGenerator):
     def tpl_file(self):
         return CHAT_FLOW_TEMPLATE_PATH / "azure_openai.yaml.jinja2"
 
-    @property
-    def entry_template_keys(self):
-        return ["connection"]
+    entry_template_keys = ("connection",)
 
 
 class OpenAIConnectionGenerator(BaseGenerator):
@@ -324,50 +399,58 @@ class OpenAIConnectionGenerator(BaseGenerator):
     def tpl_file(self):
         return CHAT_FLOW_TEMPLATE_PATH / "openai.yaml.jinja2"
 
-    @property
-    def entry_template_keys(self):
-        return ["connection"]
+    entry_template_keys = ("connection",)
 
 
 def copy_extra_files(flow_path, extra_files, overwrite=False):
+    flow_path = Path(flow_path)
+    # One scandir answers the existence checks for all extra files instead of
+    # a stat per file. copy2 already uses zero-copy syscalls where available.
+    try:
+        existing = {entry.name for entry in os.scandir(flow_path)}
+    except FileNotFoundError:
+        existing = set()
+    messages = []
     for file_name in extra_files:
-        extra_file_path = (
-            Path(__file__).parent.parent / "data" / "entry_flow" / EXTRA_FILES_MAPPING.get(file_name, file_name)
-        )
-        target_path = Path(flow_path) / file_name
-        if target_path.exists() and not overwrite:
+        extra_file_path = TEMPLATE_PATH / EXTRA_FILES_MAPPING.get(file_name, file_name)
+        target_path = flow_path / file_name
+        exists = file_name in existing
+        if exists and not overwrite:
             continue
-        action = "Overwriting" if target_path.exists() else "Creating"
-        print(f"{action} {target_path.resolve()}...")
+        action = "Overwriting" if exists else "Creating"
+        messages.append(f"{action} {target_path.resolve()}...")
         shutil.copy2(extra_file_path, target_path)
+    if messages:
+        # Emit all status lines in one buffered write instead of a print per file.
+        sys.stdout.write("\n".join(messages) + "\n")
 
 
 class ToolPackageGenerator(BaseGenerator):
     def __init__(self, tool_name, icon=None, extra_info=None):
         self.tool_name = tool_name
         self._extra_info = extra_info
+        self._parsed_extra_info = None
         self.icon = icon
 
     @property
     def extra_info(self):
-        if self._extra_info:
+        # _extra_info is immutable after construction, so literal_eval runs
+        # once per key instead of on every property access.
+        if self._parsed_extra_info is None:
             extra_info = {}
-            for k, v in self._extra_info.items():
+            for k, v in (self._extra_info or {}).items():
                 try:
                     extra_info[k] = literal_eval(v)
                 except Exception:
                     extra_info[k] = repr(v)
-            return extra_info
-        else:
-            return {}
+            self._parsed_extra_info = extra_info
+        return self._parsed_extra_info
 
     @property
     def tpl_file(self):
         return TOOL_TEMPLATE_PATH / "tool.py.jinja2"
 
-    @property
-    def entry_template_keys(self):
-        return ["tool_name", "extra_info", "icon"]
+    entry_template_keys = ("tool_name", "extra_info", "icon")
 
 
 class ManifestGenerator(BaseGenerator):
@@ -378,9 +461,7 @@ class ManifestGenerator(BaseGenerator):
     def tpl_file(self):
         return TOOL_TEMPLATE_PATH / "MANIFEST.in.jinja2"
 
-    @property
-    def entry_template_keys(self):
-        return ["package_name"]
+    entry_template_keys = ("package_name",)
 
 
 class SetupGenerator(BaseGenerator):
@@ -392,9 +473,7 @@ class SetupGenerator(BaseGenerator):
     def tpl_file(self):
         return TOOL_TEMPLATE_PATH / "setup.py.jinja2"
 
-    @property
-    def entry_template_keys(self):
-        return ["package_name", "tool_name"]
+    entry_template_keys = ("package_name", "tool_name")
 
 
 class ToolPackageUtilsGenerator(BaseGenerator):
@@ -405,9 +484,7 @@ class ToolPackageUtilsGenerator(BaseGenerator):
     def tpl_file(self):
         return TOOL_TEMPLATE_PATH / "utils.py.jinja2"
 
-    @property
-    def entry_template_keys(self):
-        return ["package_name"]
+    entry_template_keys = ("package_name",)
 
 
 class ToolReadmeGenerator(BaseGenerator):
@@ -419,9 +496,7 @@ class ToolReadmeGenerator(BaseGenerator):
     def tpl_file(self):
         return TOOL_TEMPLATE_PATH / "README.md.jinja2"
 
-    @property
-    def entry_template_keys(self):
-        return ["package_name", "tool_name"]
+    entry_template_keys = ("package_name", "tool_name")
 
 
 class InitGenerator(BaseGenerator):
@@ -429,11 +504,14 @@ class InitGenerator(BaseGenerator):
     def tpl_file(self):
         return TOOL_TEMPLATE_PATH / "init.py"
 
-    @property
-    def entry_template_keys(self):
-        pass
+    entry_template_keys = ()
 
     def generate(self) -> str:
         with open(self.tpl_file) as f:
             init_content = f.read()
         return init_content
+
+    def _dump(self, f):
+        # The init file is copied verbatim, not rendered.
+        with open(self.tpl_file, "rb") as src:
+            shutil.copyfileobj(src, f)
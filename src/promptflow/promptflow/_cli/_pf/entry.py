@@ -10,29 +10,33 @@ start_time = time.perf_counter()
 
 # E402 module level import not at top of file
 import argparse  # noqa: E402
+import importlib  # noqa: E402
 import logging  # noqa: E402
 import sys  # noqa: E402
 
-from promptflow._cli._pf._config import add_config_parser, dispatch_config_commands  # noqa: E402
-from promptflow._cli._pf._connection import add_connection_parser, dispatch_connection_commands  # noqa: E402
-from promptflow._cli._pf._flow import add_flow_parser, dispatch_flow_commands  # noqa: E402
-from promptflow._cli._pf._run import add_run_parser, dispatch_run_commands  # noqa: E402
-from promptflow._cli._pf._tool import add_tool_parser, dispatch_tool_commands  # noqa: E402
-from promptflow._cli._pf.help import show_privacy_statement, show_welcome_message  # noqa: E402
-from promptflow._cli._user_agent import USER_AGENT  # noqa: E402
-from promptflow._sdk._constants import LOGGER_NAME  # noqa: E402
-from promptflow._sdk._logger_factory import LoggerFactory  # noqa: E402
-from promptflow._sdk._utils import (print_pf_version, setup_user_agent_to_operation_context,  # noqa: E402
-                                    get_promptflow_sdk_version)  # noqa: E402
-
-# configure logger for CLI
-logger = LoggerFactory.get_logger(name=LOGGER_NAME, verbosity=logging.WARNING)
+# Map each action to the module providing its add_<action>_parser and
+# dispatch_<action>_commands. Modules are imported on demand so that e.g.
+# `pf run show` never pays the import cost of the flow/tool subtrees.
+_ACTION_MODULES = {
+    "flow": "promptflow._cli._pf._flow",
+    "connection": "promptflow._cli._pf._connection",
+    "run": "promptflow._cli._pf._run",
+    "config": "promptflow._cli._pf._config",
+    "tool": "promptflow._cli._pf._tool",
+}
 
 
 def entry(argv):
     """
     Control plane CLI tools for promptflow.
     """
+    from promptflow._sdk._constants import LOGGER_NAME
+    from promptflow._sdk._logger_factory import LoggerFactory
+    from promptflow._sdk._utils import print_pf_version
+
+    # configure logger for CLI
+    logger = LoggerFactory.get_logger(name=LOGGER_NAME, verbosity=logging.WARNING)
+
     parser = argparse.ArgumentParser(
         prog="pf",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -41,38 +45,36 @@ def entry(argv):
     parser.add_argument(
         "-v", "--version", dest="version", action="store_true", help="show current CLI version and exit"
     )
+    # Guarantee the logging flags exist on the namespace so dispatch can read
+    # them directly instead of probing with hasattr.
+    parser.set_defaults(verbose=False, debug=False)
 
     subparsers = parser.add_subparsers()
-    add_flow_parser(subparsers)
-    add_connection_parser(subparsers)
-    add_run_parser(subparsers)
-    add_config_parser(subparsers)
-    add_tool_parser(subparsers)
+    # When the first argument names a known action, register only that action's
+    # subparser; help and unknown commands fall back to registering everything.
+    if argv and argv[0] in _ACTION_MODULES:
+        actions = [argv[0]]
+    else:
+        actions = list(_ACTION_MODULES)
+    modules = {}
+    for action in actions:
+        module = importlib.import_module(_ACTION_MODULES[action])
+        getattr(module, f"add_{action}_parser")(subparsers)
+        modules[action] = module
 
     args = parser.parse_args(argv)
     # Log the init finish time
     init_finish_time = time.perf_counter()
     try:
-        # --verbose, enable info logging
-        if hasattr(args, "verbose") and args.verbose:
-            for handler in logging.getLogger(LOGGER_NAME).handlers:
-                handler.setLevel(logging.INFO)
-        # --debug, enable debug logging
-        if hasattr(args, "debug") and args.debug:
+        # --debug takes precedence over --verbose
+        level = logging.DEBUG if args.debug else logging.INFO if args.verbose else None
+        if level is not None:
             for handler in logging.getLogger(LOGGER_NAME).handlers:
-                handler.setLevel(logging.DEBUG)
+                handler.setLevel(level)
         if args.version:
             print_pf_version()
-        elif args.action == "flow":
-            dispatch_flow_commands(args)
-        elif args.action == "connection":
-            dispatch_connection_commands(args)
-        elif args.action == "run":
-            dispatch_run_commands(args)
-        elif args.action == "config":
-            dispatch_config_commands(args)
-        elif args.action == "tool":
-            dispatch_tool_commands(args)
+        elif args.action in modules:
+            getattr(modules[args.action], f"dispatch_{args.action}_commands")(args)
     except KeyboardInterrupt as ex:
         logger.debug("Keyboard interrupt is captured.")
         raise ex
@@ -98,13 +100,22 @@ def main():
     """Entrance of pf CLI."""
     command_args = sys.argv[1:]
     if len(command_args) == 1 and command_args[0] == 'version':
+        # Answer `pf version` before any action module or user agent setup is
+        # touched; only the version helper is imported.
+        from promptflow._sdk._utils import get_promptflow_sdk_version
+
         version_dict = {"promptflow": get_promptflow_sdk_version()}
         return json.dumps(version_dict, ensure_ascii=False, indent=2, sort_keys=True, separators=(',', ': ')) + '\n'
     if len(command_args) == 0:
         # print privacy statement & welcome message like azure-cli
+        from promptflow._cli._pf.help import show_privacy_statement, show_welcome_message
+
         show_privacy_statement()
         show_welcome_message()
         command_args.append("-h")
+    from promptflow._cli._user_agent import USER_AGENT
+    from promptflow._sdk._utils import setup_user_agent_to_operation_context
+
     setup_user_agent_to_operation_context(USER_AGENT)
     entry(command_args)
 
@@ -4,7 +4,9 @@
 
 import functools
 import inspect
+import itertools
 import logging
+import secrets
 import threading
 import time
 import uuid
@@ -16,7 +18,7 @@ from promptflow._core._errors import ToolExecutionError, UnexpectedError
 from promptflow._core.cache_manager import AbstractCacheManager, CacheInfo, CacheResult
 from promptflow._core.operation_context import OperationContext
 from promptflow._utils.logger_utils import flow_logger, logger
-from promptflow._utils.thread_utils import RepeatLogTimer
+from promptflow._utils.thread_utils import SlowInvocationMonitor
 from promptflow._utils.utils import generate_elapsed_time_messages
 from promptflow.contracts.flow import Node
 from promptflow.contracts.run_info import RunInfo
@@ -27,6 +29,17 @@ from .thread_local_singleton import ThreadLocalSingleton
 from .tracer import Tracer
 
 
+# One monitor shared by all node invocations in this process; sub-second tool
+# calls only pay a dict insert/delete instead of a timer thread each.
+_slow_node_monitor = SlowInvocationMonitor(interval_seconds=60)
+
+
+@functools.lru_cache(maxsize=256)
+def _module_of(f) -> str:
+    """Resolve the defining module of a tool callable once; nodes reuse the same callable across lines."""
+    return f.func.__module__ if isinstance(f, functools.partial) else f.__module__
+
+
 class FlowExecutionContext(ThreadLocalSingleton):
     """The context for a flow execution."""
 
@@ -50,6 +63,18 @@ class FlowExecutionContext(ThreadLocalSingleton):
         self._flow_id = flow_id or self._run_id
         self._line_number = line_number
         self._variant_id = variant_id
+        # run_id and line_number are immutable for this context, so the parent
+        # run id and node run id prefix can be formatted once instead of per node.
+        self._parent_run_id = f"{self._run_id}_{line_number}" if line_number is not None else self._run_id
+        self._node_run_id_prefix = f"{self._run_id}_"
+        # Unique node run id suffixes come from one random salt plus a counter,
+        # instead of an os.urandom-backed uuid4 per node invocation.
+        self._node_id_salt = secrets.token_hex(8)
+        self._node_id_counter = itertools.count()
+        # flow-id and root-run-id never change for the lifetime of this context,
+        # so the operation context only needs to be primed once. copy() builds a
+        # fresh instance, which re-primes for the thread running the copy.
+        self._op_context_primed = False
 
     def copy(self):
         return FlowExecutionContext(
@@ -63,8 +88,11 @@ class FlowExecutionContext(ThreadLocalSingleton):
         )
 
     def _update_operation_context(self):
+        if self._op_context_primed:
+            return
         flow_context_info = {"flow-id": self._flow_id, "root-run-id": self._run_id}
         OperationContext.get_instance().update(flow_context_info)
+        self._op_context_primed = True
 
     def invoke_tool(self, node: Node, f: Callable, kwargs):
         run_info = self._prepare_node_run(node, f, kwargs)
@@ -110,17 +138,21 @@ class FlowExecutionContext(ThreadLocalSingleton):
         self._update_operation_context()
         node_run_id = self._generate_node_run_id(node)
         flow_logger.info(f"Executing node {node.name}. node run id: {node_run_id}")
-        parent_run_id = f"{self._run_id}_{self._line_number}" if self._line_number is not None else self._run_id
         run_info: RunInfo = self._run_tracker.start_node_run(
             node=node.name,
             flow_run_id=self._run_id,
-            parent_run_id=parent_run_id,
+            parent_run_id=self._parent_run_id,
             run_id=node_run_id,
             index=self._line_number,
         )
         run_info.index = self._line_number
         run_info.variant_id = self._variant_id
-        self._run_tracker.set_inputs(node_run_id, {key: value for key, value in kwargs.items() if key != "self"})
+        if "self" in kwargs:
+            inputs = {key: value for key, value in kwargs.items() if key != "self"}
+        else:
+            # Common case: no bound instance in kwargs, skip the copy.
+            inputs = kwargs
+        self._run_tracker.set_inputs(node_run_id, inputs)
         return run_info
 
     async def invoke_tool_async(self, node: Node, f: Callable, kwargs):
@@ -150,7 +182,7 @@ class FlowExecutionContext(ThreadLocalSingleton):
             self._run_tracker.persist_node_run(run_info)
 
     async def _invoke_tool_async_inner(self, node: Node, f: Callable, kwargs):
-        module = f.func.__module__ if isinstance(f, functools.partial) else f.__module__
+        module = _module_of(f)
         try:
             return await f(**kwargs)
         except PromptflowException as e:
@@ -166,7 +198,7 @@ class FlowExecutionContext(ThreadLocalSingleton):
             raise ToolExecutionError(node_name=node.name, module=module) from e
 
     def _invoke_tool_with_timer(self, node: Node, f: Callable, kwargs):
-        module = f.func.__module__ if isinstance(f, functools.partial) else f.__module__
+        module = _module_of(f)
         node_name = node.name
         try:
             logging_name = node_name
@@ -175,8 +207,7 @@ class FlowExecutionContext(ThreadLocalSingleton):
             interval_seconds = 60
             start_time = time.perf_counter()
             thread_id = threading.current_thread().ident
-            with RepeatLogTimer(
-                interval_seconds=interval_seconds,
+            with _slow_node_monitor.monitor(
                 logger=logger,
                 level=WARNING,
                 log_message_function=generate_elapsed_time_messages,
@@ -199,11 +230,10 @@ class FlowExecutionContext(ThreadLocalSingleton):
         """Update teh bypassed node run info."""
         node_run_id = self._generate_node_run_id(node)
         flow_logger.info(f"Bypassing node {node.name}. node run id: {node_run_id}")
-        parent_run_id = f"{self._run_id}_{self._line_number}" if self._line_number is not None else self._run_id
         run_info = self._run_tracker.bypass_node_run(
             node=node.name,
             flow_run_id=self._run_id,
-            parent_run_id=parent_run_id,
+            parent_run_id=self._parent_run_id,
             run_id=node_run_id,
             index=self._line_number,
             variant_id=self._variant_id,
@@ -222,7 +252,7 @@ class FlowExecutionContext(ThreadLocalSingleton):
     def _generate_node_run_id(self, node: Node) -> str:
         if node.aggregation:
             # For reduce node, the id should be constructed by the flow run info run id
-            return f"{self._run_id}_{node.name}_reduce"
+            return f"{self._node_run_id_prefix}{node.name}_reduce"
         if self._line_number is None:
-            return f"{self._run_id}_{node.name}_{uuid.uuid4()}"
-        return f"{self._run_id}_{node.name}_{self._line_number}"
+            return f"{self._node_run_id_prefix}{node.name}_{self._node_id_salt}{next(self._node_id_counter)}"
+        return f"{self._node_run_id_prefix}{node.name}_{self._line_number}"
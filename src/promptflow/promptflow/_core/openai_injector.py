@@ -6,7 +6,7 @@ import functools
 import inspect
 import os
 import pkg_resources
-from datetime import datetime
+from time import time as _now
 
 import openai
 
@@ -40,7 +40,7 @@ def inject_function(args_to_ignore=None, trace_type=TraceType.LLM):
                 name=name,
                 type=trace_type,
                 inputs=all_kwargs,
-                start_time=datetime.utcnow().timestamp(),
+                start_time=_now(),
             )
             Tracer.push(trace)
             try:
@@ -2,12 +2,13 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # ---------------------------------------------------------
 
+import functools
 import inspect
 import json
 import logging
 from collections.abc import Iterator
 from contextvars import ContextVar
-from datetime import datetime
+from time import time as _now
 from typing import Optional
 
 from promptflow._core.generator_proxy import GeneratorProxy, generate_from_proxy
@@ -18,6 +19,24 @@ from promptflow.contracts.trace import Trace, TraceType
 
 from .thread_local_singleton import ThreadLocalSingleton
 
+# Optional fast encoder for trace export; stdlib json remains the fallback
+# since orjson is not a declared dependency.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Reused by the serialization probe in to_serializable; building a JSONEncoder
+# per call would repeat the encoder setup on every traced value.
+_probe_encode = json.JSONEncoder(default=default_json_encoder).encode
+
+
+@functools.lru_cache(maxsize=256)
+def _param_names(f) -> tuple:
+    """Extract the parameter names of a callable once; push_tool sees the same functions repeatedly."""
+    return tuple(inspect.signature(f).parameters)
+
 
 class Tracer(ThreadLocalSingleton):
     CONTEXT_VAR_NAME = "Tracer"
@@ -28,6 +47,10 @@ class Tracer(ThreadLocalSingleton):
         self._node_name = node_name
         self._traces = []
         self._trace_stack = []
+        # Traces whose inputs/outputs still hold raw values; serialization is
+        # deferred until a consumer asks for to_json. Keyed by id since Trace
+        # dataclasses are not hashable; the traces stay alive via _traces.
+        self._pending_serialize = {}
 
     @classmethod
     def start_tracing(cls, run_id, node_name: Optional[str] = None):
@@ -60,13 +83,17 @@ class Tracer(ThreadLocalSingleton):
             logging.warning(msg)
             return []
         tracer._deactivate_in_context()
-        return tracer.to_json()
+        traces = tracer.to_json()
+        # Drop the trace tree eagerly; after serialization nothing should keep
+        # thousands of Trace objects alive for the gc to walk.
+        tracer._traces = []
+        tracer._trace_stack = []
+        return traces
 
     @classmethod
     def push_tool(cls, f, args=[], kwargs={}):
         obj = cls.active_instance()
-        sig = inspect.signature(f).parameters
-        all_kwargs = {**{k: v for k, v in zip(sig.keys(), args)}, **kwargs}
+        all_kwargs = {**dict(zip(_param_names(f), args)), **kwargs}
         all_kwargs = {
             k: ConnectionType.serialize_conn(v) if ConnectionType.is_connection_value(v) else v
             for k, v in all_kwargs.items()
@@ -76,7 +103,7 @@ class Tracer(ThreadLocalSingleton):
         trace = Trace(
             name=f.__qualname__,
             type=TraceType.TOOL,
-            start_time=datetime.utcnow().timestamp(),
+            start_time=_now(),
             inputs=all_kwargs,
         )
         obj._push(trace)
@@ -92,13 +119,38 @@ class Tracer(ThreadLocalSingleton):
 
     @staticmethod
     def to_serializable(obj):
-        if isinstance(obj, dict) and all(isinstance(k, str) for k in obj.keys()):
-            return {k: Tracer.to_serializable(v) for k, v in obj.items()}
+        if obj is None or isinstance(obj, (str, int, float, bool)):
+            # Primitives dominate tool inputs/outputs and are serializable as-is.
+            return obj
         if isinstance(obj, GeneratorProxy):
             return obj
+        if not (isinstance(obj, dict) and all(isinstance(k, str) for k in obj.keys())):
+            return Tracer._serialize_leaf(obj)
+        # Walk nested str-keyed dicts with an explicit worklist instead of
+        # recursion, so deep LLM message payloads neither pay a Python frame
+        # per level nor hit the recursion limit.
+        root = {}
+        stack = [(obj, root)]
+        while stack:
+            src, dst = stack.pop()
+            for k, v in src.items():
+                if v is None or isinstance(v, (str, int, float, bool)):
+                    dst[k] = v
+                elif isinstance(v, GeneratorProxy):
+                    dst[k] = v
+                elif isinstance(v, dict) and all(isinstance(x, str) for x in v.keys()):
+                    child = {}
+                    dst[k] = child
+                    stack.append((v, child))
+                else:
+                    dst[k] = Tracer._serialize_leaf(v)
+        return root
+
+    @staticmethod
+    def _serialize_leaf(obj):
         try:
             obj = serialize(obj)
-            json.dumps(obj, default=default_json_encoder)
+            _probe_encode(obj)
         except Exception:
             # We don't want to fail the whole function call because of a serialization error,
             # so we simply convert it to str if it cannot be serialized.
@@ -107,9 +159,17 @@ class Tracer(ThreadLocalSingleton):
 
     def _push(self, trace: Trace):
         if trace.inputs:
-            trace.inputs = self.to_serializable(trace.inputs)
+            if isinstance(trace.inputs, dict):
+                # Shallow-copy to snapshot the mapping now; deep serialization is
+                # deferred so traces discarded before to_json never pay for it.
+                trace.inputs = dict(trace.inputs)
+                self._pending_serialize[id(trace)] = trace
+            else:
+                # Non-mapping inputs (lists, scalars, arbitrary objects) cannot
+                # be snapshotted cheaply; serialize them eagerly as before.
+                trace.inputs = self.to_serializable(trace.inputs)
         if not trace.start_time:
-            trace.start_time = datetime.utcnow().timestamp()
+            trace.start_time = _now()
         if not self._trace_stack:
             # Set node name for root trace
             trace.node_name = self._node_name
@@ -129,10 +189,11 @@ class Tracer(ThreadLocalSingleton):
         if isinstance(output, Iterator):
             output = GeneratorProxy(output)
         if output is not None:
-            last_trace.output = self.to_serializable(output)
+            last_trace.output = output
+            self._pending_serialize[id(last_trace)] = last_trace
         if error is not None:
             last_trace.error = self._format_error(error)
-        self._trace_stack[-1].end_time = datetime.utcnow().timestamp()
+        self._trace_stack[-1].end_time = _now()
         self._trace_stack.pop()
 
         if isinstance(output, GeneratorProxy):
@@ -141,8 +202,25 @@ class Tracer(ThreadLocalSingleton):
             return output
 
     def to_json(self) -> list:
+        for trace in self._pending_serialize.values():
+            if trace.inputs:
+                trace.inputs = self.to_serializable(trace.inputs)
+            if trace.output is not None:
+                trace.output = self.to_serializable(trace.output)
+        self._pending_serialize.clear()
         return serialize(self._traces)
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize the trace tree straight to a JSON wire payload.
+
+        For callers that immediately encode the traces, this skips building
+        and then re-walking the intermediate Python structure with stdlib json.
+        """
+        traces = self.to_json()
+        if orjson is not None:
+            return orjson.dumps(traces, default=default_json_encoder, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(traces, default=default_json_encoder).encode("utf-8")
+
     @staticmethod
     def _format_error(error: Exception) -> dict:
         return {
@@ -1,6 +1,7 @@
 # ---------------------------------------------------------
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # ---------------------------------------------------------
+import functools
 import logging
 import os.path
 import uuid
@@ -9,8 +10,6 @@ from os import PathLike
 from pathlib import Path
 from typing import Optional, Union
 
-import pydash
-
 from promptflow._sdk._constants import (
     FLOW_DIRECTORY_MACRO_IN_CONFIG,
     HOME_PROMPT_FLOW_DIR,
@@ -25,6 +24,49 @@ from promptflow.exceptions import ErrorTarget, ValidationException
 logger = LoggerFactory.get_logger(name=LOGGER_NAME, verbosity=logging.WARNING)
 
 
+@functools.lru_cache(maxsize=32)
+def _split_key(key: str) -> tuple:
+    return tuple(key.split("."))
+
+
+def _get_by_key(config: dict, key: str):
+    """Walk a flat dotted key through nested dicts; None when any level is missing."""
+    current = config
+    for part in _split_key(key):
+        if not isinstance(current, dict) or part not in current:
+            return None
+        current = current[part]
+    return current
+
+
+def _set_by_key(config: dict, key: str, value) -> None:
+    """Set a flat dotted key, creating intermediate dicts as needed."""
+    parts = _split_key(key)
+    current = config
+    for part in parts[:-1]:
+        nxt = current.get(part)
+        if not isinstance(nxt, dict):
+            nxt = {}
+            current[part] = nxt
+        current = nxt
+    current[parts[-1]] = value
+
+
+# Resolved workspace arm ids keyed by the (resolved) starting path; each entry
+# remembers the config file it came from and its mtime so edits are picked up
+# while repeat calls skip the multi-level directory scan and MLClient parse.
+_workspace_cache = {}
+
+
+def _validate_run_output_path(value: str) -> None:
+    if value.rstrip("/").endswith(FLOW_DIRECTORY_MACRO_IN_CONFIG):
+        raise InvalidConfigValue(
+            "Cannot specify flow directory as run output path; "
+            "if you want to specify run output path under flow directory, "
+            "please use its child folder, e.g. '${flow_directory}/.runs'."
+        )
+
+
 class ConfigFileNotFound(ValidationException):
     pass
 
@@ -45,6 +87,9 @@ class Configuration(object):
     INSTALLATION_ID = "cli.installation_id"
     CONNECTION_PROVIDER = "connection.provider"
     RUN_OUTPUT_PATH = "run.output_path"
+    # Per-key validators, looked up by _validate; keys without an entry need
+    # no validation.
+    _VALIDATORS = {RUN_OUTPUT_PATH: _validate_run_output_path}
     _instance = None
 
     def __init__(self, overrides=None):
@@ -55,13 +100,14 @@ class Configuration(object):
             with open(self.CONFIG_PATH, "w") as f:
                 f.write(dump_yaml({}))
         self._config = load_yaml(self.CONFIG_PATH)
+        self._config_mtime = os.path.getmtime(self.CONFIG_PATH)
         if not self._config:
             self._config = {}
         # Allow config override by kwargs
         overrides = overrides or {}
         for key, value in overrides.items():
             self._validate(key, value)
-            pydash.set_(self._config, key, value)
+            _set_by_key(self._config, key, value)
 
     @property
     def config(self):
@@ -69,23 +115,38 @@ class Configuration(object):
 
     @classmethod
     def get_instance(cls):
-        """Use this to get instance to avoid multiple copies of same global config."""
-        if cls._instance is None:
+        """Use this to get instance to avoid multiple copies of same global config.
+
+        The cached instance is reused until the config file's mtime changes, so
+        repeated callers skip the disk read and YAML parse while still picking
+        up edits made by other processes.
+        """
+        try:
+            mtime = os.path.getmtime(cls.CONFIG_PATH)
+        except OSError:
+            mtime = None
+        if cls._instance is None or cls._instance._config_mtime != mtime:
             cls._instance = Configuration()
         return cls._instance
 
     def set_config(self, key, value):
         """Store config in file to avoid concurrent write."""
         self._validate(key, value)
-        pydash.set_(self._config, key, value)
-        with open(self.CONFIG_PATH, "w") as f:
+        if _get_by_key(self._config, key) == value:
+            # No-op writes (e.g. repeated telemetry consent) skip the disk entirely.
+            return
+        _set_by_key(self._config, key, value)
+        # Write to a sibling temp file and rename so readers never observe a
+        # partially written config.
+        tmp_path = self.CONFIG_PATH.with_suffix(self.CONFIG_PATH.suffix + ".tmp")
+        with open(tmp_path, "w") as f:
             f.write(dump_yaml(self._config))
+        os.replace(tmp_path, self.CONFIG_PATH)
+        # Our own write should not invalidate the cached instance.
+        self._config_mtime = os.path.getmtime(self.CONFIG_PATH)
 
     def get_config(self, key):
-        try:
-            return pydash.get(self._config, key, None)
-        except Exception:  # pylint: disable=broad-except
-            return None
+        return _get_by_key(self._config, key)
 
     def get_all(self):
         return self._config
@@ -110,6 +171,15 @@ class Configuration(object):
         from azure.ai.ml.constants._common import AZUREML_RESOURCE_PROVIDER, RESOURCE_ID_FORMAT
 
         path = Path(".") if path is None else Path(path)
+        cache_key = str(path.resolve())
+        cached = _workspace_cache.get(cache_key)
+        if cached is not None:
+            config_path, config_mtime, arm_id = cached
+            try:
+                if os.path.getmtime(config_path) == config_mtime:
+                    return arm_id
+            except OSError:
+                pass
         if path.is_file():
             found_path = path
         else:
@@ -159,7 +229,12 @@ class Configuration(object):
                 f"subscription_id: {subscription_id}, resource_group: {resource_group}, "
                 f"workspace_name: {workspace_name} from file {found_path}."
             )
-        return RESOURCE_ID_FORMAT.format(subscription_id, resource_group, AZUREML_RESOURCE_PROVIDER, workspace_name)
+        arm_id = RESOURCE_ID_FORMAT.format(subscription_id, resource_group, AZUREML_RESOURCE_PROVIDER, workspace_name)
+        try:
+            _workspace_cache[cache_key] = (str(found_path), os.path.getmtime(found_path), arm_id)
+        except OSError:
+            pass
+        return arm_id
 
     def get_connection_provider(self) -> Optional[str]:
         """Get the current connection provider. Default to local if not configured."""
@@ -206,11 +281,6 @@ class Configuration(object):
 
     @staticmethod
     def _validate(key: str, value: str) -> None:
-        if key == Configuration.RUN_OUTPUT_PATH:
-            if value.rstrip("/").endswith(FLOW_DIRECTORY_MACRO_IN_CONFIG):
-                raise InvalidConfigValue(
-                    "Cannot specify flow directory as run output path; "
-                    "if you want to specify run output path under flow directory, "
-                    "please use its child folder, e.g. '${flow_directory}/.runs'."
-                )
-        return
+        validator = Configuration._VALIDATORS.get(key)
+        if validator is not None:
+            validator(value)
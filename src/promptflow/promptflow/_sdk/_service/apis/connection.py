@@ -2,6 +2,7 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # ---------------------------------------------------------
 
+import threading
 
 from flask import jsonify, request
 from flask_restx import Namespace, Resource, fields
@@ -13,6 +14,18 @@ from promptflow._sdk.operations._connection_operations import ConnectionOperatio
 
 api = Namespace("Connections", description="Connections Management")
 
+# ConnectionOperations opens the local DB on construction; reuse one instance
+# per worker thread instead of rebuilding it for every request.
+_ops_local = threading.local()
+
+
+def _get_connection_ops() -> ConnectionOperations:
+    connection_ops = getattr(_ops_local, "connection_ops", None)
+    if connection_ops is None:
+        connection_ops = _ops_local.connection_ops = ConnectionOperations()
+    return connection_ops
+
+
 # Response model of list connections
 list_connection_field = api.model(
     "Connection",
@@ -28,6 +41,14 @@ list_connection_field = api.model(
 # Response model of connection operation
 dict_field = api.schema_model("ConnectionDict", {"additionalProperties": True, "type": "object"})
 
+# Keys exposed by the list endpoint; applied while building the response so
+# flask-restx does not re-walk every dict against the schema via marshal_with.
+# The datetime keys still go through the declared field's formatter to keep
+# the wire format marshal_with produced.
+_LIST_CONNECTION_KEYS = ("name", "type", "module", "expiry_time", "created_date", "last_modified_date")
+_LIST_CONNECTION_DATETIME_KEYS = ("expiry_time", "created_date", "last_modified_date")
+_datetime_field = fields.DateTime()
+
 
 @api.errorhandler(ConnectionNotFoundError)
 def handle_connection_not_found_exception(error):
@@ -38,17 +59,24 @@ def handle_connection_not_found_exception(error):
 @api.route("/")
 class ConnectionList(Resource):
     @api.doc(description="List all connection")
-    @api.marshal_with(list_connection_field, skip_none=True, as_list=True)
+    @api.response(code=200, description="Connections", model=[list_connection_field])
     @local_user_only
     def get(self):
-        connection_op = ConnectionOperations()
+        connection_op = _get_connection_ops()
         # parse query parameters
         max_results = request.args.get("max_results", default=50, type=int)
         all_results = request.args.get("all_results", default=False, type=bool)
 
         connections = connection_op.list(max_results=max_results, all_results=all_results)
-        connections_dict = [connection._to_dict() for connection in connections]
-        return connections_dict
+        connections_dict = []
+        for connection in connections:
+            connection_dict = connection._to_dict()
+            item = {key: value for key in _LIST_CONNECTION_KEYS if (value := connection_dict.get(key)) is not None}
+            for key in _LIST_CONNECTION_DATETIME_KEYS:
+                if key in item:
+                    item[key] = _datetime_field.format(item[key])
+            connections_dict.append(item)
+        return jsonify(connections_dict)
 
 
 @api.route("/<string:name>")
@@ -58,7 +86,7 @@ class Connection(Resource):
     @api.response(code=200, description="Connection details", model=dict_field)
     @local_user_only
     def get(self, name: str):
-        connection_op = ConnectionOperations()
+        connection_op = _get_connection_ops()
         connection = connection_op.get(name=name, raise_error=True)
         connection_dict = connection._to_dict()
         return jsonify(connection_dict)
@@ -67,7 +95,7 @@ class Connection(Resource):
     @api.response(code=200, description="Connection details", model=dict_field)
     @local_user_only
     def post(self, name: str):
-        connection_op = ConnectionOperations()
+        connection_op = _get_connection_ops()
         connection_data = request.get_json(force=True)
         connection_data["name"] = name
         connection = _Connection._load(data=connection_data)
@@ -78,7 +106,7 @@ class Connection(Resource):
     @api.response(code=200, description="Connection details", model=dict_field)
     @local_user_only
     def put(self, name: str):
-        connection_op = ConnectionOperations()
+        connection_op = _get_connection_ops()
         connection_dict = request.get_json(force=True)
         params_override = [{k: v} for k, v in connection_dict.items()]
         existing_connection = connection_op.get(name)
@@ -90,7 +118,7 @@ class Connection(Resource):
     @api.doc(description="Delete connection")
     @local_user_only
     def delete(self, name: str):
-        connection_op = ConnectionOperations()
+        connection_op = _get_connection_ops()
         connection_op.delete(name=name)
 
 
@@ -100,7 +128,7 @@ class ConnectionWithSecret(Resource):
     @api.response(code=200, description="Connection details with secret", model=dict_field)
     @local_user_only
     def get(self, name: str):
-        connection_op = ConnectionOperations()
+        connection_op = _get_connection_ops()
         connection = connection_op.get(name=name, with_secrets=True, raise_error=True)
         connection_dict = connection._to_dict()
         return jsonify(connection_dict)
@@ -1,17 +1,26 @@
 # ---------------------------------------------------------
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # ---------------------------------------------------------
-import json
-import subprocess
+import contextlib
+import os
+import threading
 import tempfile
 from dataclasses import asdict
 from pathlib import Path
 
-from flask import Response, jsonify, request
+# Optional speedup, matching the service app's JSON provider; orjson is not a
+# declared dependency so stdlib json remains the fallback.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from flask import jsonify, request, send_file
 from flask_restx import Namespace, Resource, fields
 
 from promptflow._sdk._constants import FlowRunProperties, get_list_view_type
 from promptflow._sdk._errors import RunNotFoundError
+from promptflow._sdk._run_functions import _create_run
 from promptflow._sdk.entities import Run as RunEntity
 from promptflow._sdk.operations._local_storage_operations import LocalStorageOperations
 from promptflow._sdk.operations._run_operations import RunOperations
@@ -19,6 +28,80 @@ from promptflow.contracts._run_management import RunMetadata
 
 api = Namespace("Runs", description="Runs Management")
 
+# RunOperations opens the local DB and loads config on construction; reuse one
+# instance per worker thread instead of rebuilding it for every request.
+_ops_local = threading.local()
+
+
+def _get_run_ops() -> RunOperations:
+    run_ops = getattr(_ops_local, "run_ops", None)
+    if run_ops is None:
+        run_ops = _ops_local.run_ops = RunOperations()
+    return run_ops
+
+
+# Detail dicts can be large and clients poll childRuns/nodeRuns together;
+# cache the parsed result per run until the backing files change on disk.
+# Node runs are additionally indexed by node name at load time so each
+# nodeRuns request is a dict lookup instead of a scan over every iteration.
+_detail_cache = {}
+_detail_cache_lock = threading.Lock()
+_DETAIL_CACHE_SIZE = 64
+
+
+def _index_node_runs(detail_dict: dict) -> dict:
+    node_runs_by_name = {}
+    for item in detail_dict["node_runs"]:
+        node_runs_by_name.setdefault(item["node"], []).append(item)
+    return node_runs_by_name
+
+
+def _artifacts_state(folder: Path) -> tuple:
+    """Fingerprint every record file one level deep: (path, mtime_ns, size)."""
+    state = []
+    for entry in os.scandir(folder):
+        if entry.is_dir():
+            for sub_entry in os.scandir(entry.path):
+                stat = sub_entry.stat()
+                state.append((sub_entry.path, stat.st_mtime_ns, stat.st_size))
+        else:
+            stat = entry.stat()
+            state.append((entry.path, stat.st_mtime_ns, stat.st_size))
+    state.sort()
+    return tuple(state)
+
+
+def _load_detail_entry(run) -> tuple:
+    """Return (detail_dict, node_runs_by_name) for a run, cached per on-disk state."""
+    local_storage_op = LocalStorageOperations(run=run)
+    try:
+        if local_storage_op._detail_path.is_file():
+            state = local_storage_op._detail_path.stat().st_mtime_ns
+        else:
+            # In-progress runs rewrite existing bucket files and per-node
+            # folders in place, which does not bump the parent directory's
+            # mtime; fingerprint the individual files so polling clients see
+            # fresh records instead of the first cached snapshot.
+            state = (
+                _artifacts_state(local_storage_op._run_infos_folder),
+                _artifacts_state(local_storage_op._node_infos_folder),
+            )
+    except OSError:
+        detail_dict = local_storage_op.load_detail()
+        return detail_dict, _index_node_runs(detail_dict)
+    with _detail_cache_lock:
+        cached = _detail_cache.get(run.name)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+    detail_dict = local_storage_op.load_detail()
+    entry = (detail_dict, _index_node_runs(detail_dict))
+    with _detail_cache_lock:
+        if len(_detail_cache) >= _DETAIL_CACHE_SIZE:
+            _detail_cache.pop(next(iter(_detail_cache)))
+        _detail_cache[run.name] = (state, entry)
+    return entry
+
+
 # Define update run request parsing
 update_run_parser = api.parser()
 update_run_parser.add_argument("display_name", type=str, location="form", required=False)
@@ -55,7 +138,7 @@ class RunList(Resource):
             max_results = None
         list_view_type = get_list_view_type(archived_only=archived_only, include_archived=include_archived)
 
-        op = RunOperations()
+        op = _get_run_ops()
         runs = op.list(max_results=max_results, list_view_type=list_view_type)
         runs_dict = [run._to_dict() for run in runs]
         return jsonify(runs_dict)
@@ -72,19 +155,12 @@ class RunSubmit(Resource):
             run = RunEntity(**run_dict)
             run_name = run._generate_run_name()
             run_dict["name"] = run_name
-        with tempfile.TemporaryDirectory() as temp_dir:
-            run_file = Path(temp_dir) / "batch_run.json"
-            with open(run_file, "w") as f:
-                json.dump(run_dict, f)
-            cmd = f"pf run create --file {run_file}"
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True)
-            _, stderr = process.communicate()
-            if process.returncode == 0:
-                run_op = RunOperations()
-                run = run_op.get(name=run_name)
-                return jsonify(run._to_dict())
-            else:
-                raise Exception(f"Create batch run failed: {stderr}")
+        # Submit in-process instead of shelling out to `pf run create`; this
+        # skips a full interpreter startup per submission and surfaces the
+        # real exception instead of a captured stderr string.
+        run = RunEntity._load(data=run_dict)
+        run = _create_run(run=run)
+        return jsonify(run._to_dict())
 
 
 @api.route("/<string:name>")
@@ -93,15 +169,15 @@ class Run(Resource):
     @api.doc(parser=update_run_parser, description="Update run")
     def put(self, name: str):
         args = update_run_parser.parse_args()
-        run_op = RunOperations()
-        tags = json.loads(args.tags) if args.tags else None
+        run_op = _get_run_ops()
+        tags = _json_loads(args.tags) if args.tags else None
         run = run_op.update(name=name, display_name=args.display_name, description=args.description, tags=tags)
         return jsonify(run._to_dict())
 
     @api.response(code=200, description="Get run info", model=dict_field)
     @api.doc(description="Get run")
     def get(self, name: str):
-        run_op = RunOperations()
+        run_op = _get_run_ops()
         run = run_op.get(name=name)
         return jsonify(run._to_dict())
 
@@ -111,10 +187,9 @@ class FlowChildRuns(Resource):
     @api.response(code=200, description="Child runs", model=list_field)
     @api.doc(description="Get child runs")
     def get(self, name: str):
-        run_op = RunOperations()
+        run_op = _get_run_ops()
         run = run_op.get(name=name)
-        local_storage_op = LocalStorageOperations(run=run)
-        detail_dict = local_storage_op.load_detail()
+        detail_dict, _ = _load_detail_entry(run)
         return jsonify(detail_dict["flow_runs"])
 
 
@@ -123,12 +198,10 @@ class FlowNodeRuns(Resource):
     @api.response(code=200, description="Node runs", model=list_field)
     @api.doc(description="Get node runs info")
     def get(self, name: str, node_name: str):
-        run_op = RunOperations()
+        run_op = _get_run_ops()
         run = run_op.get(name=name)
-        local_storage_op = LocalStorageOperations(run=run)
-        detail_dict = local_storage_op.load_detail()
-        node_runs = [item for item in detail_dict["node_runs"] if item["node"] == node_name]
-        return jsonify(node_runs)
+        _, node_runs_by_name = _load_detail_entry(run)
+        return jsonify(node_runs_by_name.get(node_name, []))
 
 
 @api.route("/<string:name>/metaData")
@@ -136,7 +209,7 @@ class MetaData(Resource):
     @api.doc(description="Get metadata of run")
     @api.response(code=200, description="Run metadata", model=dict_field)
     def get(self, name: str):
-        run_op = RunOperations()
+        run_op = _get_run_ops()
         run = run_op.get(name=name)
         local_storage_op = LocalStorageOperations(run=run)
         metadata = RunMetadata(
@@ -159,7 +232,7 @@ class LogContent(Resource):
     @api.doc(description="Get run log content")
     @api.response(code=200, description="Log content", model=fields.String)
     def get(self, name: str):
-        run_op = RunOperations()
+        run_op = _get_run_ops()
         run = run_op.get(name=name)
         local_storage_op = LocalStorageOperations(run=run)
         log_content = local_storage_op.logger.get_logs()
@@ -171,7 +244,7 @@ class Metrics(Resource):
     @api.doc(description="Get run metrics")
     @api.response(code=200, description="Run metrics", model=dict_field)
     def get(self, name: str):
-        run_op = RunOperations()
+        run_op = _get_run_ops()
         run = run_op.get(name=name)
         local_storage_op = LocalStorageOperations(run=run)
         metrics = local_storage_op.load_metrics()
@@ -184,14 +257,27 @@ class VisualizeRun(Resource):
     @api.response(code=200, description="Visualize run", model=fields.String)
     @api.produces(["text/html"])
     def get(self, name: str):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            run_op = RunOperations()
-            run = run_op.get(name=name)
-            html_path = Path(temp_dir) / "visualize_run.html"
-            run_op.visualize(run, html_path=html_path)
-
-            with open(html_path, "r") as f:
-                return Response(f.read(), mimetype="text/html")
+        run_op = _get_run_ops()
+        run = run_op.get(name=name)
+        # Write to a standalone temp file and unlink it once the response is
+        # closed; holding a handle into a TemporaryDirectory would break its
+        # cleanup on Windows, where open files cannot be removed.
+        fd, html_path = tempfile.mkstemp(prefix="visualize_run_", suffix=".html")
+        os.close(fd)
+        try:
+            run_op.visualize(run, html_path=Path(html_path))
+            response = send_file(html_path, mimetype="text/html")
+        except Exception:
+            with contextlib.suppress(OSError):
+                os.unlink(html_path)
+            raise
+
+        @response.call_on_close
+        def _cleanup():
+            with contextlib.suppress(OSError):
+                os.unlink(html_path)
+
+        return response
 
 
 @api.route("/<string:name>/archive")
@@ -199,7 +285,7 @@ class ArchiveRun(Resource):
     @api.doc(description="Archive run")
     @api.response(code=200, description="Archived run", model=dict_field)
     def get(self, name: str):
-        run_op = RunOperations()
+        run_op = _get_run_ops()
         run = run_op.archive(name=name)
         return jsonify(run._to_dict())
 
@@ -209,6 +295,6 @@ class RestoreRun(Resource):
     @api.doc(description="Restore run")
     @api.response(code=200, description="Restored run", model=dict_field)
     def get(self, name: str):
-        run_op = RunOperations()
+        run_op = _get_run_ops()
         run = run_op.restore(name=name)
         return jsonify(run._to_dict())
@@ -11,6 +11,27 @@ from promptflow._sdk._service.apis.connection import api as connection_api
 from promptflow._sdk._service.apis.run import api as run_api
 from promptflow._sdk._utils import get_promptflow_sdk_version, read_write_by_user
 
+# orjson is an optional speedup for the service's JSON (de)serialization; the
+# stock Flask provider remains the fallback when it is not installed.
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+
+    class ORJSONProvider(JSONProvider):
+        def dumps(self, obj, **kwargs):
+            option = orjson.OPT_NON_STR_KEYS
+            if kwargs.get("indent"):
+                option |= orjson.OPT_INDENT_2
+            if kwargs.get("sort_keys"):
+                option |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+except ImportError:
+    ORJSONProvider = None
+
 
 def heartbeat():
     response = {"sdk_version": get_promptflow_sdk_version()}
@@ -19,6 +40,9 @@ def heartbeat():
 
 def create_app():
     app = Flask(__name__)
+    if ORJSONProvider is not None:
+        # Large run detail payloads serialize several times faster with orjson.
+        app.json = ORJSONProvider(app)
     app.add_url_rule("/heartbeat", view_func=heartbeat)
     with app.app_context():
         api_v1 = Blueprint("Prompt Flow Service", __name__, url_prefix="/v1.0")
@@ -2,8 +2,9 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # ---------------------------------------------------------
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Union
+from typing import Callable, List, Union
 
 from promptflow import PFClient
 from promptflow._constants import LINE_NUMBER_KEY
@@ -13,6 +14,7 @@ from promptflow._sdk._serving._errors import UnexpectedConnectionProviderReturn,
 from promptflow._sdk._serving.utils import validate_request_data
 from promptflow._sdk._utils import (
     dump_flow_result,
+    get_executable_flow_from_dag,
     get_local_connections_from_executable,
     override_connection_config_with_environment_variable,
     print_yellow_warning,
@@ -23,7 +25,7 @@ from promptflow._sdk.entities._connection import _Connection
 from promptflow._sdk.entities._flow import Flow
 from promptflow._sdk.operations._flow_operations import FlowOperations
 from promptflow._utils.multimedia_utils import convert_multimedia_data_to_base64, persist_multimedia_data
-from promptflow.contracts.flow import Flow as ExecutableFlow
+from promptflow.contracts.multimedia import PFBytes
 from promptflow.executor import FlowExecutor
 from promptflow.storage._run_storage import DefaultRunStorage
 
@@ -53,13 +55,16 @@ class FlowInvoker:
         **kwargs,
     ):
         self.flow_entity = flow if isinstance(flow, Flow) else load_flow(source=flow)
-        self._executable_flow = ExecutableFlow._from_dict(
+        # Identical DAGs share one parsed executable flow across invokers.
+        self._executable_flow = get_executable_flow_from_dag(
             flow_dag=self.flow_entity.dag, working_dir=self.flow_entity.code
         )
         self.connections = connections or {}
         self.streaming = streaming if isinstance(streaming, Callable) else lambda: streaming
         # Pass dump_to path to dump flow result for extension.
         self._dump_to = kwargs.get("dump_to", None)
+        # Thread pool for invoke_batch, allocated on first use.
+        self._pool = None
 
         self._init_connections(connection_provider)
         self._init_executor()
@@ -67,7 +72,13 @@ class FlowInvoker:
         self._dump_file_prefix = "chat" if self._is_chat_flow else "flow"
 
     def _init_connections(self, connection_provider):
-        self._is_chat_flow, _, _ = FlowOperations._is_chat_flow(self._executable_flow)
+        # The chat-flow check walks the flow graph; executable flows are shared
+        # across invokers (see get_executable_flow_from_dag), so cache the
+        # result on the instance for cross-invoker reuse.
+        self._is_chat_flow = getattr(self._executable_flow, "_cached_is_chat_flow", None)
+        if self._is_chat_flow is None:
+            self._is_chat_flow, _, _ = FlowOperations._is_chat_flow(self._executable_flow)
+            self._executable_flow._cached_is_chat_flow = self._is_chat_flow
         connection_provider = "local" if connection_provider is None else connection_provider
         if isinstance(connection_provider, str):
             logger.info(f"Getting connections from pf client with provider {connection_provider}...")
@@ -76,6 +87,7 @@ class FlowInvoker:
                 executable=self._executable_flow,
                 client=PFClient(config={"connection.provider": connection_provider}),
                 connections_to_ignore=list(self.connections.keys()),
+                cache_key=connection_provider,
             )
             self.connections.update(connections)
         elif isinstance(connection_provider, Callable):
@@ -123,11 +135,15 @@ class FlowInvoker:
         :return: The result of executor.
         :rtype: ~promptflow.executor._result.LineResult
         """
-        logger.info(f"PromptFlow invoker received data: {data}")
-
-        logger.info(f"Validating flow input with data {data!r}")
+        # Gate the f-strings so request payloads are not stringified when the
+        # log level filters the records anyway.
+        log_enabled = logger.isEnabledFor(logging.INFO)
+        if log_enabled:
+            logger.info(f"PromptFlow invoker received data: {data}")
+            logger.info(f"Validating flow input with data {data!r}")
         validate_request_data(self.flow, data)
-        logger.info(f"Execute flow with data {data!r}")
+        if log_enabled:
+            logger.info(f"Execute flow with data {data!r}")
         # Pass index 0 as extension require for dumped result.
         # TODO: Remove this index after extension remove this requirement.
         result = self.executor.exec_line(data, index=0, allow_generator_output=self.streaming())
@@ -152,7 +168,56 @@ class FlowInvoker:
         print_yellow_warning(f"Result: {result.output}")
         return resolved_outputs
 
+    def invoke_batch(self, items: List[dict], max_workers: int = 32) -> List[dict]:
+        """
+        Process multiple flow requests concurrently and return their outputs in order.
+
+        Validation happens up front for the whole batch; lines are then executed
+        through a shared thread pool so LLM-bound I/O overlaps across requests.
+        Generator (streaming) output is not supported for batched invocation.
+
+        :param items: The request data dicts, each with flow input as keys.
+        :type items: List[dict]
+        :param max_workers: The pool size used when the pool is first created, defaults to 32.
+        :type max_workers: int, optional
+        :return: The flow output dicts, in the same order as the inputs.
+        :rtype: List[dict]
+        """
+        for data in items:
+            validate_request_data(self.flow, data)
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="flow-invoker")
+        results = list(
+            self._pool.map(
+                lambda pair: self.executor.exec_line(pair[1], index=pair[0], allow_generator_output=False),
+                enumerate(items),
+            )
+        )
+        resolved_outputs = []
+        for result in results:
+            result.output.pop(LINE_NUMBER_KEY, None)
+            resolved_outputs.append(self._convert_multimedia_data_to_base64(result))
+            self._dump_invoke_result(result)
+        return resolved_outputs
+
+    @staticmethod
+    def _contains_multimedia(output: dict) -> bool:
+        stack = list(output.values())
+        while stack:
+            value = stack.pop()
+            if isinstance(value, PFBytes):
+                return True
+            if isinstance(value, dict):
+                stack.extend(value.values())
+            elif isinstance(value, list):
+                stack.extend(value)
+        return False
+
     def _convert_multimedia_data_to_base64(self, invoke_result):
+        if not self._contains_multimedia(invoke_result.output):
+            # Text-only outputs (the common case) need no conversion; skip the
+            # per-key recursive rebuild entirely.
+            return invoke_result.output
         resolved_outputs = {
             k: convert_multimedia_data_to_base64(v, with_type=True, dict_type=True)
             for k, v in invoke_result.output.items()
@@ -6,11 +6,11 @@
 import contextlib
 import os
 import tempfile
+import threading
 from os import PathLike
 from pathlib import Path
 
 from dotenv import load_dotenv
-from pydash import objects
 
 from promptflow._sdk._constants import (
     DEFAULT_VAR_ID,
@@ -28,6 +28,7 @@ from promptflow._sdk._load_functions import load_flow
 from promptflow._sdk._utils import (
     _get_additional_includes,
     _merge_local_code_and_additional_includes,
+    get_executable_flow_from_dag,
     get_local_connections_from_executable,
     get_used_connection_names_from_dict,
     update_dict_value_with_connections,
@@ -36,13 +37,22 @@ from promptflow._sdk.entities._flow import Flow
 from promptflow._utils.context_utils import _change_working_dir
 from promptflow._utils.flow_utils import dump_flow_dag, load_flow_dag
 from promptflow.contracts.flow import Flow as ExecutableFlow
+from promptflow.contracts.tool import ToolType
 
 
-def overwrite_variant(flow_dag: dict, tuning_node: str = None, variant: str = None, drop_node_variants: bool = False):
+def overwrite_variant(
+    flow_dag: dict,
+    tuning_node: str = None,
+    variant: str = None,
+    drop_node_variants: bool = False,
+    *,
+    node_index: dict = None,
+):
     # need to overwrite default variant if tuning node and variant not specified.
     # check tuning_node & variant
-    node_name_2_node = {node["name"]: node for node in flow_dag[NODES]}
-    if tuning_node and tuning_node not in node_name_2_node:
+    if node_index is None:
+        node_index = {node["name"]: node for node in flow_dag[NODES]}
+    if tuning_node and tuning_node not in node_index:
         raise InvalidFlowError(f"Node {tuning_node} not found in flow")
     if tuning_node and variant:
         try:
@@ -51,10 +61,8 @@ def overwrite_variant(flow_dag: dict, tuning_node: str = None, variant: str = No
             raise InvalidFlowError(f"Variant {variant} not found for node {tuning_node}") from e
     try:
         node_variants = flow_dag.pop(NODE_VARIANTS, {}) if drop_node_variants else flow_dag.get(NODE_VARIANTS, {})
-        updated_nodes = []
         for node in flow_dag.get(NODES, []):
             if not node.get(USE_VARIANTS, False):
-                updated_nodes.append(node)
                 continue
             # update variant
             node_name = node["name"]
@@ -69,32 +77,49 @@ def overwrite_variant(flow_dag: dict, tuning_node: str = None, variant: str = No
             if variant_id not in variants_cfg.get(VARIANTS, {}):
                 raise InvalidFlowError(f"Cannot find the variant {variant_id} for {node_name}.")
             variant_cfg = variants_cfg[VARIANTS][variant_id][NODE]
-            updated_nodes.append({"name": node_name, **variant_cfg})
-        flow_dag[NODES] = updated_nodes
+            # Swap the node config in place so dict identities stay stable and
+            # a prebuilt node index remains valid after the overwrite.
+            updated_node = {"name": node_name, **variant_cfg}
+            node.clear()
+            node.update(updated_node)
     except KeyError as e:
         raise InvalidFlowError("Failed to overwrite tuning node with variant") from e
 
 
-def overwrite_connections(flow_dag: dict, connections: dict, working_dir: PathLike):
+def overwrite_connections(flow_dag: dict, connections: dict, working_dir: PathLike, *, node_index: dict = None):
     if not connections:
         return
 
     if not isinstance(connections, dict):
         raise InvalidFlowError(f"Invalid connections overwrite format: {connections}, only list is supported.")
 
-    # Load executable flow to check if connection is LLM connection
-    executable_flow = ExecutableFlow._from_dict(flow_dag=flow_dag, working_dir=Path(working_dir))
-
-    node_name_2_node = {node["name"]: node for node in flow_dag[NODES]}
+    if node_index is None:
+        node_index = {node["name"]: node for node in flow_dag[NODES]}
 
     for node_name, connection_dict in connections.items():
-        if node_name not in node_name_2_node:
+        if node_name not in node_index:
             raise InvalidFlowError(f"Node {node_name} not found in flow")
         if not isinstance(connection_dict, dict):
             raise InvalidFlowError(f"Invalid connection overwrite format: {connection_dict}, only dict is supported.")
-        node = node_name_2_node[node_name]
-        executable_node = executable_flow.get_node(node_name=node_name)
-        if executable_flow.is_llm_node(executable_node):
+
+    # LLM nodes are identifiable from the dag itself; building the executable
+    # flow (graph walk + tool loading) is only needed to validate connection
+    # inputs of non-LLM nodes, so skip it when every target node is an LLM
+    # node — the common case of plain connection/deployment overrides.
+    if any(node_index[node_name].get("type") != ToolType.LLM for node_name in connections):
+        # Identical DAGs (e.g. across a variant sweep) reuse one cached parse.
+        executable_flow = get_executable_flow_from_dag(flow_dag=flow_dag, working_dir=working_dir)
+    else:
+        executable_flow = None
+
+    for node_name, connection_dict in connections.items():
+        node = node_index[node_name]
+        if executable_flow is None:
+            is_llm_node = True
+        else:
+            executable_node = executable_flow.get_node(node_name=node_name)
+            is_llm_node = executable_flow.is_llm_node(executable_node)
+        if is_llm_node:
             unsupported_keys = connection_dict.keys() - SUPPORTED_CONNECTION_FIELDS
             if unsupported_keys:
                 raise InvalidFlowError(
@@ -120,17 +145,45 @@ def overwrite_connections(flow_dag: dict, connections: dict, working_dir: PathLi
                 node[INPUTS][c] = v
 
 
+def _set_by_dotted_path(container, path: str, value):
+    """Set a dotted path in nested dicts/lists, creating intermediate dicts as needed."""
+    keys = path.split(".")
+    current = container
+    for key in keys[:-1]:
+        if isinstance(current, list):
+            current = current[int(key)]
+        else:
+            nxt = current.get(key)
+            if not isinstance(nxt, (dict, list)):
+                nxt = {}
+                current[key] = nxt
+            current = nxt
+    if isinstance(current, list):
+        current[int(keys[-1])] = value
+    else:
+        current[keys[-1]] = value
+
+
 def overwrite_flow(flow_dag: dict, params_overrides: dict):
     if not params_overrides:
         return
 
-    # update flow dag & change nodes list to name: obj dict
-    flow_dag[NODES] = {node["name"]: node for node in flow_dag[NODES]}
-    # apply overrides on flow dag
+    # Overrides address nodes by name (e.g. "nodes.node1.inputs.key"); resolve
+    # the node through an index built once instead of converting the nodes
+    # list to a dict and back for every call.
+    node_index = {node["name"]: node for node in flow_dag.get(NODES, [])}
     for param, val in params_overrides.items():
-        objects.set_(flow_dag, param, val)
-    # revert nodes to list
-    flow_dag[NODES] = list(flow_dag[NODES].values())
+        keys = param.split(".")
+        if len(keys) > 1 and keys[0] == NODES and keys[1] in node_index:
+            node = node_index[keys[1]]
+            if len(keys) == 2:
+                # Replace the whole node config in place, keeping list order.
+                node.clear()
+                node.update(val)
+            else:
+                _set_by_dotted_path(node, ".".join(keys[2:]), val)
+        else:
+            _set_by_dotted_path(flow_dag, param, val)
 
 
 def remove_additional_includes(flow_path: Path):
@@ -152,12 +205,28 @@ def variant_overwrite_context(
     """Override variant and connections in the flow."""
     flow_dag_path, flow_dag = load_flow_dag(flow_path)
     flow_dir_path = flow_dag_path.parent
+    if (
+        not any((tuning_node, variant, connections, overrides))
+        and NODE_VARIANTS not in flow_dag
+        and not any(node.get(USE_VARIANTS, False) for node in flow_dag.get(NODES, []))
+        and not _get_additional_includes(flow_dag_path)
+    ):
+        # Nothing to overwrite and no variants to resolve: the dumped dag would
+        # be identical to the original file, so skip the temp dir and the YAML
+        # round-trip and serve the flow from its own folder.
+        yield Flow(code=flow_dir_path, path=flow_dag_path, dag=flow_dag)
+        return
+    # Build the node index once; overwrite_variant swaps node configs in place
+    # so the same index stays valid for overwrite_connections.
+    node_index = {node["name"]: node for node in flow_dag.get(NODES, [])}
     if _get_additional_includes(flow_dag_path):
         # Merge the flow folder and additional includes to temp folder.
         with _merge_local_code_and_additional_includes(code_path=flow_path) as temp_dir:
             # always overwrite variant since we need to overwrite default variant if not specified.
-            overwrite_variant(flow_dag, tuning_node, variant, drop_node_variants=drop_node_variants)
-            overwrite_connections(flow_dag, connections, working_dir=flow_dir_path)
+            overwrite_variant(
+                flow_dag, tuning_node, variant, drop_node_variants=drop_node_variants, node_index=node_index
+            )
+            overwrite_connections(flow_dag, connections, working_dir=flow_dir_path, node_index=node_index)
             overwrite_flow(flow_dag, overrides)
             flow_dag.pop("additional_includes", None)
             dump_flow_dag(flow_dag, Path(temp_dir))
@@ -167,34 +236,69 @@ def variant_overwrite_context(
         # Generate a flow, the code path points to the original flow folder,
         # the dag path points to the temp dag file after overwriting variant.
         with tempfile.TemporaryDirectory() as temp_dir:
-            overwrite_variant(flow_dag, tuning_node, variant, drop_node_variants=drop_node_variants)
-            overwrite_connections(flow_dag, connections, working_dir=flow_dir_path)
+            overwrite_variant(
+                flow_dag, tuning_node, variant, drop_node_variants=drop_node_variants, node_index=node_index
+            )
+            overwrite_connections(flow_dag, connections, working_dir=flow_dir_path, node_index=node_index)
             overwrite_flow(flow_dag, overrides)
             flow_path = dump_flow_dag(flow_dag, Path(temp_dir))
             flow = Flow(code=flow_dir_path, path=flow_path, dag=flow_dag)
             yield flow
 
 
+# Default PFClient shared by SubmitterHelper helpers; constructing one opens
+# local config and the connection store, which dominates when the helpers run
+# in loops (variant sweeps, bulk runs).
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def _get_default_client():
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                from .._pf_client import PFClient
+
+                _default_client = PFClient()
+    return _default_client
+
+
+def _reset_default_client():
+    global _default_client
+    with _default_client_lock:
+        _default_client = None
+
+
 class SubmitterHelper:
     @classmethod
     def init_env(cls, environment_variables):
         # TODO: remove when executor supports env vars in request
         if isinstance(environment_variables, dict):
-            os.environ.update(environment_variables)
+            if any(key.startswith("PF_") for key in environment_variables):
+                # PF_* variables can change client behavior; rebuild the
+                # shared default client on next use.
+                _reset_default_client()
+            # Each os.environ assignment triggers a putenv syscall; in batch
+            # loops most entries repeat unchanged, so only set what differs.
+            for key, value in environment_variables.items():
+                if os.environ.get(key) != value:
+                    os.environ[key] = value
         elif isinstance(environment_variables, (str, PathLike, Path)):
             load_dotenv(environment_variables)
 
     @staticmethod
     def resolve_connections(flow: Flow, client=None, connections_to_ignore=None) -> dict:
-        from .._pf_client import PFClient
-
-        client = client or PFClient()
+        # Only cache for the default client; a caller-provided client may point
+        # at a different connection source we cannot key on.
+        cache_key = "local-default" if client is None else None
+        client = client or _get_default_client()
         with _change_working_dir(flow.code):
             executable = ExecutableFlow.from_yaml(flow_file=flow.path, working_dir=flow.code)
         executable.name = str(Path(flow.code).stem)
 
         return get_local_connections_from_executable(
-            executable=executable, client=client, connections_to_ignore=connections_to_ignore
+            executable=executable, client=client, connections_to_ignore=connections_to_ignore, cache_key=cache_key
         )
 
     @staticmethod
@@ -203,9 +307,7 @@ class SubmitterHelper:
 
     @classmethod
     def resolve_environment_variables(cls, environment_variables: dict, client=None):
-        from .._pf_client import PFClient
-
-        client = client or PFClient()
+        client = client or _get_default_client()
         if not environment_variables:
             return None
         connection_names = get_used_connection_names_from_dict(environment_variables)
@@ -3,6 +3,7 @@
 # ---------------------------------------------------------
 
 import collections
+import copy
 import hashlib
 import json
 import logging
@@ -14,6 +15,7 @@ import shutil
 import stat
 import sys
 import tempfile
+import time
 import zipfile
 from contextlib import contextmanager
 from enum import Enum
@@ -835,24 +837,70 @@ def copy_tree_respect_template_and_ignore_file(source: Path, target: Path, rende
             )
 
 
-def get_local_connections_from_executable(executable, client, connections_to_ignore: List[str] = None):
+# Resolved connection dicts keyed by provider + connection names; each fetch
+# hits the local store (and possibly keyring) per connection, so short-lived
+# reuse amortizes bursts of invoker/submitter creation for the same flow.
+_connections_cache = {}
+_CONNECTIONS_CACHE_TTL_SECONDS = 10.0
+
+
+def get_local_connections_from_executable(
+    executable, client, connections_to_ignore: List[str] = None, cache_key=None
+):
     """Get local connections from executable.
 
     executable: The executable flow object.
     client: Local client to get connections.
     connections_to_ignore: The connection names to ignore when getting connections.
+    cache_key: Optional hashable identifying the connection source (e.g. the provider);
+        when given, results are reused for a short TTL across calls with the same key.
     """
 
     connection_names = executable.get_connection_names()
     connections_to_ignore = connections_to_ignore or []
+    if cache_key is not None:
+        key = (cache_key, tuple(sorted(connection_names)), frozenset(connections_to_ignore))
+        entry = _connections_cache.get(key)
+        if entry is not None and time.time() - entry[0] < _CONNECTIONS_CACHE_TTL_SECONDS:
+            # Deep-copy so callers mutating the result (e.g. env var overrides)
+            # do not corrupt the cached copy.
+            return copy.deepcopy(entry[1])
     result = {}
     for n in connection_names:
         if n not in connections_to_ignore:
             conn = client.connections.get(name=n, with_secrets=True)
             result[n] = conn._to_execution_connection_dict()
+    if cache_key is not None:
+        _connections_cache[key] = (time.time(), copy.deepcopy(result))
     return result
 
 
+# Parsed executable flows keyed by working dir and a DAG content fingerprint.
+# Serving and variant-overwrite paths parse identical DAGs repeatedly; the
+# cache holds the pristine parse and hands out copies, since callers such as
+# FlowExecutor._create_from_flow rebuild the node list in place when applying
+# default variants.
+_executable_flow_cache = collections.OrderedDict()
+_EXECUTABLE_FLOW_CACHE_SIZE = 16
+
+
+def get_executable_flow_from_dag(flow_dag: dict, working_dir):
+    """Parse a flow dag into an executable flow, reusing the parse for identical DAGs."""
+    from promptflow.contracts.flow import Flow as ExecutableFlow
+
+    fingerprint = (
+        str(working_dir),
+        hashlib.sha256(json.dumps(flow_dag, sort_keys=True, default=str).encode("utf-8")).hexdigest(),
+    )
+    executable = _executable_flow_cache.get(fingerprint)
+    if executable is None:
+        executable = ExecutableFlow._from_dict(flow_dag=flow_dag, working_dir=Path(working_dir))
+        if len(_executable_flow_cache) >= _EXECUTABLE_FLOW_CACHE_SIZE:
+            _executable_flow_cache.popitem(last=False)
+        _executable_flow_cache[fingerprint] = executable
+    return copy.deepcopy(executable)
+
+
 def _generate_connections_dir():
     # Get Python executable path
     python_path = sys.executable
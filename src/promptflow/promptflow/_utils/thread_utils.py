@@ -2,9 +2,11 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # ---------------------------------------------------------
 
+import contextlib
 import contextvars
 import logging
 import threading
+import time
 
 from promptflow._utils.utils import set_context
 
@@ -39,3 +41,55 @@ class RepeatLogTimer(threading.Timer):
                 for msg in msgs:
                     self._logger.log(self._level, msg)
         self.finished.set()
+
+
+class SlowInvocationMonitor:
+    """Log periodic messages for invocations that outlive an interval.
+
+    RepeatLogTimer spawns one OS thread per guarded call; when most calls finish
+    in well under the interval the timer never fires, yet the thread churn is
+    paid every time. This monitor keeps a registry of active invocations and a
+    single shared daemon thread that wakes once per interval, so guarding a call
+    costs a dict insert and delete. The trade-off is that the first message for
+    a slow call may arrive up to one interval later than RepeatLogTimer would
+    log it.
+    """
+
+    def __init__(self, interval_seconds: float):
+        self._interval = interval_seconds
+        self._lock = threading.Lock()
+        self._active = {}
+        self._thread = None
+
+    @contextlib.contextmanager
+    def monitor(self, logger: logging.Logger, level: int, log_message_function, args: tuple = None):
+        token = object()
+        entry = (time.perf_counter(), logger, level, log_message_function, args or tuple(), contextvars.copy_context())
+        with self._lock:
+            self._active[token] = entry
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="slow_invocation_monitor")
+                self._thread.start()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active.pop(token, None)
+
+    def _run(self):
+        while True:
+            time.sleep(self._interval)
+            with self._lock:
+                entries = list(self._active.values())
+            now = time.perf_counter()
+            for start_time, logger, level, log_message_function, function_args, context in entries:
+                if now - start_time < self._interval:
+                    continue
+                try:
+                    for msg in log_message_function(*function_args):
+                        # Run in the invoking thread's context so log records
+                        # are routed the same way RepeatLogTimer routed them.
+                        context.run(logger.log, level, msg)
+                except Exception:
+                    # Monitoring must never take down the monitored work.
+                    pass
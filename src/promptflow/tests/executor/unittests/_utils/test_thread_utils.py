@@ -6,7 +6,7 @@ from logging import WARNING, Logger, StreamHandler
 
 import pytest
 
-from promptflow._utils.thread_utils import RepeatLogTimer
+from promptflow._utils.thread_utils import RepeatLogTimer, SlowInvocationMonitor
 from promptflow._utils.utils import generate_elapsed_time_messages
 
 
@@ -40,3 +40,45 @@ class TestRepeatLogTimer:
         assert logs, "Logs are empty."
         for log in logs:
             assert re.match(log_pattern, log), f"The wrong log: {log}"
+
+
+@pytest.mark.skipif(sys.platform == "darwin", reason="Skip on Mac")
+@pytest.mark.unittest
+class TestSlowInvocationMonitor:
+    def test_slow_invocation_is_logged(self):
+        s = StringIO()
+        logger = Logger("test_slow_invocation_monitor")
+        logger.addHandler(StreamHandler(s))
+        interval_seconds = 1
+        monitor = SlowInvocationMonitor(interval_seconds=interval_seconds)
+        start_time = time.perf_counter()
+        with monitor.monitor(
+            logger=logger,
+            level=WARNING,
+            log_message_function=generate_elapsed_time_messages,
+            args=("Test", start_time, interval_seconds, None),
+        ):
+            time.sleep(3.5)
+        logs = [log for log in s.getvalue().split("\n") if log]
+        log_pattern = re.compile(
+            r"^Test has been running for [0-9]+ seconds, thread None cannot be found in sys._current_frames, "
+            r"maybe it has been terminated due to unexpected errors.$"
+        )
+        assert logs, "Logs are empty."
+        for log in logs:
+            assert re.match(log_pattern, log), f"The wrong log: {log}"
+
+    def test_fast_invocation_is_not_logged(self):
+        s = StringIO()
+        logger = Logger("test_slow_invocation_monitor_fast")
+        logger.addHandler(StreamHandler(s))
+        monitor = SlowInvocationMonitor(interval_seconds=10)
+        start_time = time.perf_counter()
+        with monitor.monitor(
+            logger=logger,
+            level=WARNING,
+            log_message_function=generate_elapsed_time_messages,
+            args=("Test", start_time, 10, None),
+        ):
+            time.sleep(0.1)
+        assert s.getvalue() == ""
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from promptflow._sdk._configuration import Configuration, InvalidConfigValue
+from promptflow._sdk._configuration import Configuration, InvalidConfigValue, _get_by_key, _set_by_key
 from promptflow._sdk._constants import FLOW_DIRECTORY_MACRO_IN_CONFIG
 
 CONFIG_DATA_ROOT = Path(__file__).parent.parent.parent / "test_configs" / "configs"
@@ -28,6 +28,17 @@ class TestConfig:
         config.set_config("test_key", "test_value")
         assert config.get_config("test_key") == "test_value"
 
+    def test_dotted_key_helpers(self):
+        data = {}
+        _set_by_key(data, "a.b.c", 1)
+        assert data == {"a": {"b": {"c": 1}}}
+        # overwriting a non-dict intermediate replaces it with a dict
+        _set_by_key(data, "a.b.c.d", 2)
+        assert data == {"a": {"b": {"c": {"d": 2}}}}
+        assert _get_by_key(data, "a.b.c.d") == 2
+        assert _get_by_key(data, "a.x.c") is None
+        assert _get_by_key(data, "a.b.c.d.e") is None
+
     def test_get_or_set_installation_id(self, config):
         user_id = config.get_or_set_installation_id()
         assert user_id is not None
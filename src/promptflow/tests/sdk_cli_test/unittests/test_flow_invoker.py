@@ -1,7 +1,10 @@
 # ---------------------------------------------------------
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # ---------------------------------------------------------
+import time
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
@@ -34,3 +37,20 @@ class TestFlowInvoker:
         with pytest.raises(UnexpectedConnectionProviderReturn) as e:
             FlowInvoker(flow=EXAMPLE_FLOW, connection_provider=lambda: [1, 2])
         assert "should be connection type" in str(e.value)
+
+    def test_invoke_batch_preserves_order(self):
+        # Exercise the batching path without a real executor: lines that finish
+        # out of order (later indexes sleep less) must still come back in input
+        # order.
+        def exec_line(data, index, allow_generator_output):
+            time.sleep(0.01 * (8 - index))
+            return SimpleNamespace(output={"answer": f"{data['question']}-{index}"})
+
+        invoker = FlowInvoker.__new__(FlowInvoker)
+        invoker.flow = None
+        invoker.executor = SimpleNamespace(exec_line=exec_line)
+        invoker._pool = None
+        invoker._dump_to = None
+        with patch("promptflow._sdk._serving.flow_invoker.validate_request_data"):
+            outputs = invoker.invoke_batch([{"question": f"q{i}"} for i in range(8)], max_workers=4)
+        assert outputs == [{"answer": f"q{i}-{i}"} for i in range(8)]
@@ -15,7 +15,8 @@ from promptflow._sdk._errors import InvalidFlowError
 from promptflow._sdk._load_functions import load_run
 from promptflow._sdk._pf_client import PFClient
 from promptflow._sdk._run_functions import create_yaml_run
-from promptflow._sdk._submitter import RunSubmitter, overwrite_variant, variant_overwrite_context
+from promptflow._sdk._submitter import RunSubmitter, overwrite_flow, overwrite_variant, variant_overwrite_context
+from promptflow._sdk._submitter.utils import _set_by_dotted_path
 from promptflow._sdk.entities import Run
 from promptflow._sdk.operations._local_storage_operations import LocalStorageOperations
 
@@ -77,6 +78,35 @@ class TestRun:
                 pass
         assert error_message in str(e.value)
 
+    def test_set_by_dotted_path(self):
+        data = {"a": {"b": 1}, "list": [{"k": 1}, {"k": 2}]}
+        _set_by_dotted_path(data, "a.b", 2)
+        # missing intermediate segments are created as dicts
+        _set_by_dotted_path(data, "a.c.d", 3)
+        # integer segments index into lists
+        _set_by_dotted_path(data, "list.1.k", 9)
+        assert data["a"] == {"b": 2, "c": {"d": 3}}
+        assert data["list"] == [{"k": 1}, {"k": 9}]
+
+    def test_overwrite_flow(self):
+        flow_dag = {
+            "nodes": [
+                {"name": "node1", "inputs": {"temperature": "0.5"}},
+                {"name": "node2", "inputs": {"text": "${inputs.text}"}},
+            ],
+        }
+        overwrite_flow(
+            flow_dag,
+            {
+                "nodes.node1.inputs.temperature": "0.2",
+                "environment.python_requirements_txt": "requirements.txt",
+            },
+        )
+        # nodes are still addressed by name and stay a list
+        assert flow_dag["nodes"][0]["inputs"]["temperature"] == "0.2"
+        assert flow_dag["nodes"][1] == {"name": "node2", "inputs": {"text": "${inputs.text}"}}
+        assert flow_dag["environment"] == {"python_requirements_txt": "requirements.txt"}
+
     def test_load_run(self):
         input_dict = {
             "data": (DATAS_DIR / "webClassification1.jsonl").resolve().as_posix(),